@@ -0,0 +1,34 @@
+"""Numba kernel for the film grain pass.
+
+Importing this module requires numba (part of the ``render`` extra); callers
+import it lazily and fall back to the NumPy implementation on ImportError.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def fill_grain(rgba: np.ndarray, strength: float, row_seeds: np.ndarray) -> None:
+    """Write grey Gaussian noise into the RGB channels of an RGBA overlay.
+
+    Generating, scaling, offsetting and clipping each sample happen in one fused
+    pass, with rows spread across cores. Every row reseeds from ``row_seeds`` so
+    the result does not depend on how rows are scheduled across threads.
+
+    Args:
+        rgba: Overlay buffer of shape (height, width, 4), modified in place.
+        strength: Grain strength; scales the standard deviation of the noise.
+        row_seeds: One seed per row of ``rgba``.
+    """
+    scale = 255.0 * strength
+    for y in prange(rgba.shape[0]):
+        np.random.seed(row_seeds[y])
+        for x in range(rgba.shape[1]):
+            value = np.random.standard_normal() * scale + 128.0
+            grey = np.uint8(min(max(value, 0.0), 255.0))
+            rgba[y, x, 0] = grey
+            rgba[y, x, 1] = grey
+            rgba[y, x, 2] = grey
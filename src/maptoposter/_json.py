@@ -0,0 +1,35 @@
+"""JSON decoding with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["loads"]
+
+_loads: Callable[[bytes | str], object]
+try:
+    import orjson
+except ImportError:  # orjson is optional (the ``fast`` extra)
+    _loads = json.loads
+else:
+    _loads = orjson.loads
+
+
+def loads(data: bytes | str) -> object:
+    """Decode a JSON document, using orjson when it is installed.
+
+    Malformed input raises ``json.JSONDecodeError`` either way, since orjson's
+    error type subclasses it.
+
+    Args:
+        data: UTF-8 encoded bytes or text.
+
+    Returns:
+        The decoded Python object.
+    """
+    return _loads(data)
@@ -14,8 +14,6 @@ from .config import (
     get_available_themes,
     load_theme,
 )
-from .geo import get_coordinates
-from .render import PosterRenderer
 from .styles import (
     StyleConfig,
     get_available_presets,
@@ -369,6 +367,11 @@ def _generate_single_city(
     Returns:
         Tuple of (city_name, success, error_message).
     """
+    # osmnx and matplotlib take over a second to import; only load them once a
+    # poster is actually generated so info commands start instantly
+    from .geo import get_coordinates
+    from .render import PosterRenderer
+
     try:
         coords = get_coordinates(city, country)
         theme = load_theme(theme_name)
@@ -571,7 +574,7 @@ def _validate_style_options(
             print("Error: Style pack file not found.")
             return 1
         try:
-            preset_style = load_style_pack(str(style_pack_path))
+            preset_style = load_style_pack(style_pack_path)
         except (OSError, ValueError) as exc:
             print(f"Error: Failed to load style pack: {exc}")
             return 1
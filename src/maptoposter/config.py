@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, cast
 
+from ._json import loads as json_loads
+
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,8 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from .styles import StyleConfig
 
 
@@ -61,6 +66,12 @@ _WINDOWS_RESERVED_NAMES = frozenset(
     | {f"LPT{i}" for i in range(1, 10)}
 )
 
+# Filename sanitization patterns
+# Windows: < > : " / \ | ? *
+# Also replace spaces, commas and quotes for consistency
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\s,\']')
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
 
 def get_package_dir() -> Path:
     """Get the package installation directory."""
@@ -139,23 +150,44 @@ def load_theme(theme_name: str = "feature_based") -> dict[str, str]:
         logger.warning("Theme file '%s' not found. Using default feature_based theme.", theme_file)
         return _get_default_theme()
 
-    with theme_file.open("r", encoding="utf-8") as f:
-        theme = json.load(f)
-        if not isinstance(theme, dict):
-            raise ValueError(f"Theme file '{theme_file}' is not a JSON object.")
-        theme_dict = cast(dict[str, str], theme)
+    # Copy so callers can modify their theme without touching the cached one
+    theme_dict = dict(_read_theme_file(theme_file, theme_name))
+
+    logger.info("Loaded theme: %s", theme_dict.get("name", theme_name))
+    if description := theme_dict.get("description"):
+        logger.info("  %s", description)
+    return theme_dict
 
-        # Validate required keys (CR-0006 fix)
-        missing_keys = REQUIRED_THEME_KEYS - theme_dict.keys()
-        if missing_keys:
-            raise ThemeValidationError(
-                f"Theme '{theme_name}' is missing required keys: {', '.join(sorted(missing_keys))}"
-            )
 
-        logger.info("Loaded theme: %s", theme_dict.get("name", theme_name))
-        if description := theme_dict.get("description"):
-            logger.info("  %s", description)
-        return theme_dict
+@lru_cache(maxsize=32)
+def _read_theme_file(theme_file: Path, theme_name: str) -> Mapping[str, str]:
+    """Parse and validate a theme file.
+
+    Cached per theme file; the returned mapping is read-only.
+
+    Args:
+        theme_file: Path to the theme JSON file.
+        theme_name: The theme name, used in error messages.
+
+    Returns:
+        A read-only mapping of theme keys to values.
+
+    Raises:
+        ThemeValidationError: If theme is missing required keys.
+        ValueError: If theme file is not a valid JSON object.
+    """
+    theme = json_loads(theme_file.read_bytes())
+    if not isinstance(theme, dict):
+        raise ValueError(f"Theme file '{theme_file}' is not a JSON object.")
+    theme_dict = cast(dict[str, str], theme)
+
+    # Validate required keys (CR-0006 fix)
+    missing_keys = REQUIRED_THEME_KEYS - theme_dict.keys()
+    if missing_keys:
+        raise ThemeValidationError(
+            f"Theme '{theme_name}' is missing required keys: {', '.join(sorted(missing_keys))}"
+        )
+    return MappingProxyType(theme_dict)
 
 
 def _get_default_theme() -> dict[str, str]:
@@ -178,10 +210,12 @@ def _get_default_theme() -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1024)
 def _sanitize_filename(name: str) -> str:
     """Sanitize string for use in filenames across platforms.
 
-    Replaces invalid characters and handles Windows reserved names.
+    Replaces invalid characters and handles Windows reserved names. Results are
+    memoized per input string.
 
     Args:
         name: The string to sanitize.
@@ -190,15 +224,13 @@ def _sanitize_filename(name: str) -> str:
         A safe filename string.
     """
     # Replace invalid characters with underscore
-    # Windows: < > : " / \ | ? *
-    # Also replace spaces and commas for consistency
-    sanitized = re.sub(r'[<>:"/\\|?*\s,\']', "_", name)
+    sanitized = _INVALID_FILENAME_CHARS.sub("_", name)
 
     # Remove leading/trailing dots and spaces (Windows issue)
     sanitized = sanitized.strip(". ")
 
     # Collapse multiple underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _REPEATED_UNDERSCORES.sub("_", sanitized)
 
     # Handle Windows reserved names
     if sanitized.upper() in _WINDOWS_RESERVED_NAMES:
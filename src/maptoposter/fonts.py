@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from matplotlib.font_manager import FontProperties
@@ -19,6 +22,9 @@ __all__ = ["FontSet", "load_fonts"]
 
 logger = logging.getLogger(__name__)
 
+# FontProperties kept per FontSet; sizes scale with the poster, so bound the cache
+_PROPERTIES_CACHE_SIZE = 64
+
 
 @dataclass
 class FontSet:
@@ -27,6 +33,12 @@ class FontSet:
     bold: Path | None = None
     regular: Path | None = None
     light: Path | None = None
+    _properties_cache: OrderedDict[tuple[str, float], FontProperties] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _properties_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     @property
     def is_loaded(self) -> bool:
@@ -40,6 +52,11 @@ class FontSet:
     ) -> FontProperties:
         """Get FontProperties for a specific weight and size.
 
+        Results are cached per (weight, size) so repeated text elements reuse a
+        single FontProperties instead of resolving the font file each time. The
+        FontSet is shared across renders, so the least recently used entries are
+        evicted once ``_PROPERTIES_CACHE_SIZE`` sizes have been requested.
+
         Args:
             weight: Font weight ('bold', 'regular', or 'light').
             size: Font size in points.
@@ -47,6 +64,22 @@ class FontSet:
         Returns:
             FontProperties configured for the requested style.
         """
+        cache_key = (weight, size)
+        with self._properties_lock:
+            cached = self._properties_cache.get(cache_key)
+            if cached is not None:
+                self._properties_cache.move_to_end(cache_key)
+                return cached
+
+        properties = self._build_properties(weight, size)
+        with self._properties_lock:
+            self._properties_cache[cache_key] = properties
+            if len(self._properties_cache) > _PROPERTIES_CACHE_SIZE:
+                self._properties_cache.popitem(last=False)
+        return properties
+
+    def _build_properties(self, weight: str, size: float) -> FontProperties:
+        """Create FontProperties for a weight and size, falling back to system fonts."""
         # Try to get the requested weight, fall back to regular, then None
         font_path = getattr(self, weight, None) or self.regular
 
@@ -69,11 +102,18 @@ class FontSet:
 def load_fonts() -> FontSet:
     """Load Roboto fonts from the fonts directory.
 
+    The FontSet is cached per fonts directory; callers share it and its
+    FontProperties cache.
+
     Returns:
         A FontSet with paths to the font files.
     """
-    fonts_dir = get_fonts_dir()
+    return _load_fonts_from(get_fonts_dir())
+
 
+@lru_cache(maxsize=4)
+def _load_fonts_from(fonts_dir: Path) -> FontSet:
+    """Build a FontSet for the Roboto fonts in ``fonts_dir``."""
     font_set = FontSet(
         bold=fonts_dir / "Roboto-Bold.ttf",
         regular=fonts_dir / "Roboto-Regular.ttf",
@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import time
+from time import sleep
 from typing import TYPE_CHECKING, cast
 
 import osmnx as ox
@@ -96,7 +96,7 @@ def get_coordinates(city: str, country: str) -> tuple[float, float]:
         coords = (float(location.latitude), float(location.longitude))
 
         # Rate limit AFTER successful API call
-        time.sleep(1)
+        sleep(1)
 
         if not cache_set(cache_key, coords, CacheType.COORDS):
             logger.warning("Failed to cache coordinates for %s", cache_key)
@@ -134,7 +134,7 @@ def fetch_graph(point: tuple[float, float], dist: float) -> MultiDiGraph:
             truncate_by_edge=True,
         )
         # Rate limit AFTER successful API call
-        time.sleep(0.5)
+        sleep(0.5)
 
         if not cache_set(cache_key, graph, CacheType.GRAPH):
             logger.warning("Failed to cache graph for %s", cache_key)
@@ -157,6 +157,15 @@ def fetch_graph(point: tuple[float, float], dist: float) -> MultiDiGraph:
         raise OSMFetchError(f"Unexpected error fetching OSM graph: {e}") from e
 
 
+def _tags_cache_key(tags: Mapping[str, bool | str | list[str]]) -> str:
+    """Return a short deterministic hash of OSM tags for use in cache keys.
+
+    Ensures cached features are invalidated when the requested tags change.
+    """
+    tags_json = json.dumps(dict(tags), sort_keys=True)
+    return hashlib.md5(tags_json.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
 def fetch_features(
     point: tuple[float, float],
     dist: float,
@@ -178,10 +187,7 @@ def fetch_features(
         OSMFetchError: If the features cannot be fetched.
     """
     lat, lon = point
-    # Create a deterministic hash of the tags to ensure cache invalidation when tags change
-    tags_json = json.dumps(dict(tags), sort_keys=True)
-    tags_hash = hashlib.md5(tags_json.encode(), usedforsecurity=False).hexdigest()[:12]
-    cache_key = f"{name}_{lat}_{lon}_{dist}_{tags_hash}"
+    cache_key = f"{name}_{lat}_{lon}_{dist}_{_tags_cache_key(tags)}"
     cached = cache_get(cache_key, CacheType.GEODATA)
     if cached is not None:
         logger.info("Using cached %s", name)
@@ -190,7 +196,7 @@ def fetch_features(
     try:
         data = ox.features_from_point(point, tags=dict(tags), dist=dist)
         # Rate limit AFTER successful API call
-        time.sleep(0.3)
+        sleep(0.3)
 
         if not cache_set(cache_key, data, CacheType.GEODATA):
             logger.warning("Failed to cache %s for %s", name, cache_key)
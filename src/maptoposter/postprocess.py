@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Protocol
+from functools import lru_cache
+from itertools import repeat
+from typing import TYPE_CHECKING, Protocol, cast
 
 import numpy as np
-from PIL import Image, ImageEnhance
+from PIL import Image, ImageEnhance, ImageStat
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Rows processed per band; bounds the float64 working set for large posters
+_BAND_ROWS = 256
+
+# Overlay size above which the fused Numba grain kernel is used when available
+_NUMBA_GRAIN_MIN_BYTES = 16 * 1024 * 1024
+
+# Batch mode renders posters on worker threads; Numba's default workqueue threading
+# layer aborts the process if two parallel kernels are launched concurrently
+_GRAIN_KERNEL_LOCK = threading.Lock()
 
 
 class RasterStyle(Protocol):
@@ -17,6 +36,11 @@ class RasterStyle(Protocol):
         """Film grain effect strength (0-1)."""
         ...
 
+    @property
+    def grain_coarseness(self) -> int:
+        """Grain size in pixels; values above 1 upsample lower-resolution grain."""
+        ...
+
     @property
     def vignette_strength(self) -> float:
         """Vignette darkening effect strength (0-1)."""
@@ -77,16 +101,31 @@ def apply_raster_effects(image: Image.Image, style: RasterStyle) -> PostProcessR
     Returns:
         PostProcessResult containing the processed image and metadata.
     """
+    # Every effect returns a new image, so an RGBA input never needs a defensive copy
+    result = image if image.mode == "RGBA" else image.convert("RGBA")
+    apply_texture = style.texture_strength > 0 and bool(style.paper_texture_path)
+    if not (
+        style.grain_strength > 0
+        or style.vignette_strength > 0
+        or apply_texture
+        or style.color_grading_strength > 0
+    ):
+        return PostProcessResult(image=result)
+
     effects: list[str] = []
-    result = image.convert("RGBA")
+    # Grain and vignette each composite a full-size RGBA overlay; they share this
+    # buffer, whose pages are only committed once a stage writes to them
+    overlay = np.empty((result.height, result.width, 4), dtype=np.uint8)
 
     if style.grain_strength > 0:
-        result = _apply_grain(result, style.grain_strength, style.seed)
+        result = _apply_grain(
+            result, style.grain_strength, style.seed, overlay, style.grain_coarseness
+        )
         effects.append("grain")
     if style.vignette_strength > 0:
-        result = _apply_vignette(result, style.vignette_strength)
+        result = _apply_vignette(result, style.vignette_strength, overlay)
         effects.append("vignette")
-    if style.texture_strength > 0 and style.paper_texture_path:
+    if apply_texture and style.paper_texture_path:
         result = _apply_texture(
             result,
             style.paper_texture_path,
@@ -104,42 +143,165 @@ def apply_raster_effects(image: Image.Image, style: RasterStyle) -> PostProcessR
     )
 
 
-def _apply_grain(image: Image.Image, strength: float, seed: int | None) -> Image.Image:
-    rng = np.random.default_rng(seed)
-    noise = rng.normal(0, 255 * strength, (image.height, image.width, 1))
-    noise = np.clip(noise + 128, 0, 255).astype(np.uint8)
-    noise_rgb = np.repeat(noise, 3, axis=2)
-    alpha = int(255 * min(strength, 1.0) * 0.35)
-    alpha_channel = np.full((image.height, image.width, 1), alpha, dtype=np.uint8)
-    noise_rgba = np.concatenate([noise_rgb, alpha_channel], axis=2)
+def _apply_grain(
+    image: Image.Image,
+    strength: float,
+    seed: int | None,
+    noise_rgba: np.ndarray,
+    coarseness: int = 1,
+) -> Image.Image:
+    height = image.height
+    noise_rgba[..., 3] = int(255 * min(strength, 1.0) * 0.35)
+
+    if coarseness > 1:
+        _fill_coarse_grain(noise_rgba, np.random.SeedSequence(seed), strength, coarseness)
+        return Image.alpha_composite(image, Image.fromarray(noise_rgba, mode="RGBA"))
+
+    kernel = _numba_grain_kernel() if noise_rgba.nbytes > _NUMBA_GRAIN_MIN_BYTES else None
+    if kernel is not None:
+        row_seeds = np.random.SeedSequence(seed).generate_state(height)
+        with _GRAIN_KERNEL_LOCK:
+            kernel(noise_rgba, strength, row_seeds)
+        return Image.alpha_composite(image, Image.fromarray(noise_rgba, mode="RGBA"))
+
+    # One independent random stream per band, so the grain depends only on the seed
+    # and not on how bands are scheduled across threads
+    band_starts = range(0, height, _BAND_ROWS)
+    streams = np.random.SeedSequence(seed).spawn(len(band_starts))
+    bands = [noise_rgba[start : start + _BAND_ROWS] for start in band_starts]
+    if len(bands) == 1:
+        _fill_grain_band(bands[0], streams[0], strength)
+    else:
+        # NumPy releases the GIL while generating and scaling the noise
+        with ThreadPoolExecutor(max_workers=min(len(bands), os.cpu_count() or 1)) as executor:
+            list(executor.map(_fill_grain_band, bands, streams, repeat(strength)))
+
     noise_image = Image.fromarray(noise_rgba, mode="RGBA")
     return Image.alpha_composite(image, noise_image)
 
 
-def _apply_vignette(image: Image.Image, strength: float) -> Image.Image:
-    width, height = image.size
-    x = np.linspace(-1, 1, width)
-    y = np.linspace(-1, 1, height)
-    xv, yv = np.meshgrid(x, y)
-    mask = np.clip(1 - (xv**2 + yv**2), 0, 1)
+def _numba_grain_kernel() -> Callable[[np.ndarray, float, np.ndarray], None] | None:
+    """Return the fused Numba grain kernel, or None if numba is not installed.
+
+    The kernel draws from a different generator than the NumPy path, so large
+    posters are reproducible per seed only within the same installation.
+    """
+    try:
+        from ._grain_kernel import fill_grain
+    except ImportError:
+        return None
+    return cast("Callable[[np.ndarray, float, np.ndarray], None]", fill_grain)
+
+
+def _fill_grain_band(band: np.ndarray, stream: np.random.SeedSequence, strength: float) -> None:
+    """Write grey Gaussian noise into the RGB channels of one band of the overlay."""
+    rng = np.random.default_rng(stream)
+    # Single-channel float32 noise, scaled and clipped in place
+    noise = rng.standard_normal(band.shape[:2], dtype=np.float32)
+    noise *= 255 * strength
+    noise += 128
+    np.clip(noise, 0, 255, out=noise)
+    band[..., :3] = noise[..., np.newaxis]
+
+
+def _fill_coarse_grain(
+    rgba: np.ndarray, stream: np.random.SeedSequence, strength: float, coarseness: int
+) -> None:
+    """Write value-noise grain into the RGB channels of the overlay.
+
+    Noise is drawn on a grid ``coarseness`` times smaller in each direction and
+    bilinearly upsampled, which cuts random number generation by ``coarseness**2``
+    and gives larger, softer grain. Upsampling runs one ``_BAND_ROWS`` band at a
+    time, so only one band of float32 noise is held at full resolution.
+    """
+    height, width = rgba.shape[:2]
+    rng = np.random.default_rng(stream)
+    low_res = rng.standard_normal(
+        (-(-height // coarseness), -(-width // coarseness)), dtype=np.float32
+    )
+    low_res_image = Image.fromarray(low_res, mode="F")
+    rows_per_output_row = low_res.shape[0] / height
+    scale = np.float32(255 * strength)
+    for start in range(0, height, _BAND_ROWS):
+        stop = min(start + _BAND_ROWS, height)
+        box = (0, start * rows_per_output_row, low_res.shape[1], stop * rows_per_output_row)
+        upsampled = low_res_image.resize((width, stop - start), Image.Resampling.BILINEAR, box=box)
+        noise = np.asarray(upsampled) * scale
+        noise += 128
+        np.clip(noise, 0, 255, out=noise)
+        rgba[start:stop, :, :3] = noise[..., np.newaxis]
+
+
+def _apply_vignette(image: Image.Image, strength: float, overlay: np.ndarray) -> Image.Image:
+    overlay[..., :3] = 0
+    overlay[..., 3] = _vignette_alpha(image.width, image.height, strength)
+    return Image.alpha_composite(image, Image.fromarray(overlay, mode="RGBA"))
+
+
+@lru_cache(maxsize=4)
+def _vignette_alpha(width: int, height: int, strength: float) -> np.ndarray:
+    """Build the vignette darkening mask for a given size and strength.
+
+    The radial falloff is separable, so each band of rows is built by broadcasting
+    a row of squared x coordinates against a column of squared y coordinates. Only
+    the uint8 result is allocated at full size; the float64 working set is bounded
+    by ``_BAND_ROWS``. Cached per size and strength; the returned array is
+    read-only.
+    """
+    xx = np.square(np.linspace(-1, 1, width))
+    yy = np.square(np.linspace(-1, 1, height))[:, np.newaxis]
     # Apply gentler vignette (1/10 of original intensity)
     effective_strength = strength * 0.1
-    mask = (mask**1.5) * (1 - effective_strength) + effective_strength * mask
-    alpha = (mask * 255).astype(np.uint8)
-    vignette = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    vignette.putalpha(Image.fromarray(255 - alpha))
-    return Image.alpha_composite(image, vignette)
+    alpha = np.empty((height, width), dtype=np.uint8)
+    for start in range(0, height, _BAND_ROWS):
+        mask = 1 - (xx + yy[start : start + _BAND_ROWS])
+        np.clip(mask, 0, 1, out=mask)
+        mask = (mask**1.5) * (1 - effective_strength) + effective_strength * mask
+        np.subtract(255, (mask * 255).astype(np.uint8), out=alpha[start : start + _BAND_ROWS])
+    alpha.setflags(write=False)
+    return alpha
 
 
 def _apply_texture(image: Image.Image, texture_path: str, strength: float) -> Image.Image:
-    texture = Image.open(texture_path).convert("RGBA").resize(image.size)
-    red, green, blue, alpha = texture.split()
-    alpha = alpha.point(lambda value: int(value * strength))
-    texture = Image.merge("RGBA", (red, green, blue, alpha))
-    return Image.alpha_composite(image, texture)
+    texture = _load_texture(texture_path).resize(image.size, Image.Resampling.BILINEAR)
+    # Scale the texture's alpha by strength in one table lookup instead of split/merge
+    return Image.alpha_composite(image, texture.point(_texture_alpha_lut(strength)))
+
+
+@lru_cache(maxsize=4)
+def _load_texture(texture_path: str) -> Image.Image:
+    """Load a paper texture as RGBA.
+
+    Cached per texture path. Callers must not modify the returned image.
+    """
+    with Image.open(texture_path) as texture:
+        return texture.convert("RGBA")
+
+
+@lru_cache(maxsize=16)
+def _texture_alpha_lut(strength: float) -> tuple[int, ...]:
+    """Build an RGBA point table that scales alpha by ``strength`` and keeps RGB."""
+    alpha = [int(value * strength) for value in range(256)]
+    return (*range(256), *range(256), *range(256), *alpha)
 
 
 def _apply_color_grading(image: Image.Image, strength: float) -> Image.Image:
     factor = 1 + min(strength, 1.0) * 0.1
     color_enhanced = ImageEnhance.Color(image).enhance(factor)
-    return ImageEnhance.Contrast(color_enhanced).enhance(factor)
+    # Same result as ImageEnhance.Contrast, as a single table lookup instead of
+    # building and blending against a full-size grey image
+    mean = int(ImageStat.Stat(color_enhanced.convert("L")).mean[0] + 0.5)
+    return color_enhanced.point(_contrast_lut(mean, factor))
+
+
+@lru_cache(maxsize=64)
+def _contrast_lut(mean: int, factor: float) -> tuple[int, ...]:
+    """Build an RGBA point table that stretches RGB around ``mean`` by ``factor``.
+
+    Mirrors Pillow's blend arithmetic (float32, clamped, truncated) so the output
+    matches ``ImageEnhance.Contrast`` exactly. Alpha is passed through unchanged.
+    """
+    values = np.arange(256, dtype=np.float32)
+    stretched = np.float32(mean) + np.float32(factor) * (values - np.float32(mean))
+    channel = np.clip(stretched, 0, 255).astype(np.uint8).tolist()
+    return (*channel, *channel, *channel, *range(256))
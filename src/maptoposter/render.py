@@ -8,12 +8,16 @@ import sys
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Protocol, cast
 
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
 import osmnx as ox
+import pandas as pd
 from matplotlib import patheffects
 from matplotlib.figure import Figure
 from PIL import Image
@@ -44,11 +48,13 @@ Image.MAX_IMAGE_PIXELS = 500_000_000  # ~500 megapixels
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from pathlib import Path
 
     from geopandas import GeoDataFrame
     from matplotlib.axes import Axes
     from networkx import MultiDiGraph
+    from pandas import Series
 
 # Datashader types - datashader is an optional dependency
 # Using Any since we can't import types from an optional package
@@ -237,14 +243,18 @@ def clear_layer_cache() -> int:
 class ZOrder:
     """Z-order constants for layer stacking."""
 
-    WATER = 1
-    WATERWAYS = 2  # Rivers/streams rendered as lines above water polygons
-    PARKS = 3
-    PATHS = 3.5  # Footpaths rendered below roads
-    ROADS = 4
-    RAILWAYS = 8  # Railways rendered above roads
-    GRADIENT = 10
-    TEXT = 100  # Text always topmost
+    WATER: Final = 1
+    WATERWAYS: Final = 2  # Rivers/streams rendered as lines above water polygons
+    PARKS: Final = 3
+    PATHS: Final = 3.5  # Footpaths rendered below roads
+    ROADS: Final = 4
+    RAILWAYS: Final = 8  # Railways rendered above roads
+    GRADIENT: Final = 10
+    TEXT: Final = 100  # Text always topmost
+
+
+# Sort key for drawing layers bottom to top
+_BY_ZORDER = attrgetter("zorder")
 
 
 HIGHWAY_CLASS_MAP: dict[str, str] = {
@@ -271,6 +281,31 @@ HIGHWAY_CLASS_MAP: dict[str, str] = {
     "steps": "path",
 }
 
+# Theme color key for each road class; any other class uses "road_default"
+_ROAD_CLASS_COLOR_KEYS: Mapping[str, str] = MappingProxyType(
+    {
+        "motorway": "road_motorway",
+        "primary": "road_primary",
+        "secondary": "road_secondary",
+        "tertiary": "road_tertiary",
+        "residential": "road_residential",
+    }
+)
+
+# Road classes that receive the style's glow effect
+_GLOW_ROAD_CLASSES = frozenset({"motorway", "primary"})
+
+# Road classes in drawing order, bottom to top
+_ROAD_CLASS_ORDER = (
+    "path",  # Footpaths rendered first (below all roads)
+    "default",
+    "residential",
+    "tertiary",
+    "secondary",
+    "primary",
+    "motorway",
+)
+
 
 @dataclass(frozen=True)
 class RenderLayer:
@@ -404,7 +439,7 @@ class DatashaderBackend:
         quality_scale = min(width_px, height_px) / 1000.0
 
         # Sort layers by zorder - casing first, then core
-        sorted_layers = sorted(road_layers, key=lambda item: item.zorder)
+        sorted_layers = sorted(road_layers, key=_BY_ZORDER)
 
         # Group casing and core layers
         casing_layers = [layer for layer in sorted_layers if "_casing" in layer.name]
@@ -538,6 +573,52 @@ class RoadStyle:
     glow_strength: float = 0.0
 
 
+@lru_cache(maxsize=256)
+def _split_city_name(display_name: str) -> str:
+    r"""Split long city names into two balanced lines for visual appeal.
+
+    Names are split at word boundaries to create roughly equal line lengths.
+    The algorithm:
+    1. If single word, return uppercase unchanged
+    2. If total character count <= 14, return single line uppercase
+    3. Otherwise, split at the midpoint of total characters, respecting word boundaries
+    4. Move words from right to left until left side is >= half the total length
+
+    Examples:
+        - "Paris" -> "PARIS"
+        - "New York" -> "NEW YORK"
+        - "Los Angeles" -> "LOS\nANGELES"
+        - "Rio de Janeiro" -> "RIO DE\nJANEIRO"
+
+    Args:
+        display_name: The city name to potentially split.
+
+    Returns:
+        Uppercase city name, possibly with newline for two-line display.
+    """
+    upper_name = display_name.upper()
+    words = upper_name.split()
+    if len(words) < 2:
+        return upper_name
+    total_len = sum(len(word) for word in words)
+    if total_len <= 14:
+        return upper_name
+
+    left_words: list[str] = []
+    right_words = words.copy()
+    left_len = 0
+    while right_words and left_len < total_len / 2:
+        word = right_words.pop(0)
+        left_words.append(word)
+        left_len += len(word)
+
+    left = " ".join(left_words).strip()
+    right = " ".join(right_words).strip()
+    if not right:
+        return upper_name
+    return f"{left}\n{right}"
+
+
 class PosterRenderer:
     """Renders map posters with customizable styling."""
 
@@ -618,13 +699,10 @@ class PosterRenderer:
         Returns:
             A list of colors corresponding to each edge.
         """
-        edge_colors = []
-
-        for _, _, data in graph.edges(data=True):
-            style = self.classify_edge(data.get("highway", "unclassified"))
-            edge_colors.append(style.core_color)
-
-        return edge_colors
+        return [
+            self._road_color(self._road_class(data.get("highway", "unclassified")))
+            for _, _, data in graph.edges(data=True)
+        ]
 
     def _normalize_highway(self, highway: OSMHighwayValue) -> str:
         """Normalize highway value to a string.
@@ -644,26 +722,42 @@ class PosterRenderer:
             return "unclassified"
         return str(highway)
 
+    def _road_classes(self, highway: Series) -> Series:
+        """Map a column of raw OSM highway values to road classes.
+
+        Plain string tags, which are the vast majority, are resolved with a single
+        vectorized dict lookup. Only list-valued or missing tags are normalized
+        one by one.
+
+        Args:
+            highway: The ``highway`` column of the edges GeoDataFrame.
+
+        Returns:
+            A Series of road class names aligned with ``highway``.
+        """
+        is_str = highway.map(type).eq(str)
+        if not is_str.all():
+            highway = highway.where(is_str, highway[~is_str].map(self._normalize_highway))
+        return highway.map(HIGHWAY_CLASS_MAP).fillna("default")
+
+    def _road_class(self, highway: OSMHighwayValue) -> str:
+        """Return the road class for a raw OSM highway value."""
+        return HIGHWAY_CLASS_MAP.get(self._normalize_highway(highway), "default")
+
+    def _road_color(self, road_class: str) -> str:
+        """Return the theme color for a road class."""
+        return self.theme[_ROAD_CLASS_COLOR_KEYS.get(road_class, "road_default")]
+
     def classify_edge(self, highway: OSMHighwayValue) -> RoadStyle:
         """Classify an edge by highway value into a RoadStyle."""
-        highway_value = self._normalize_highway(highway)
-        road_class = HIGHWAY_CLASS_MAP.get(highway_value, "default")
-        if road_class == "motorway":
-            color = self.theme["road_motorway"]
-        elif road_class == "primary":
-            color = self.theme["road_primary"]
-        elif road_class == "secondary":
-            color = self.theme["road_secondary"]
-        elif road_class == "tertiary":
-            color = self.theme["road_tertiary"]
-        elif road_class == "residential":
-            color = self.theme["road_residential"]
-        else:
-            color = self.theme["road_default"]
+        return self._road_style(self._road_class(highway))
 
+    def _road_style(self, road_class: str) -> RoadStyle:
+        """Build the RoadStyle for a road class."""
+        color = self._road_color(road_class)
         core_width = self.style.road_core_widths.get(road_class, ROAD_WIDTH_DEFAULT)
         casing_width = self.style.road_casing_widths.get(road_class, core_width)
-        glow = self.style.road_glow_strength if road_class in {"motorway", "primary"} else 0.0
+        glow = self.style.road_glow_strength if road_class in _GLOW_ROAD_CLASSES else 0.0
 
         return RoadStyle(
             road_class=road_class,
@@ -683,13 +777,13 @@ class PosterRenderer:
         Returns:
             A list of widths corresponding to each edge.
         """
-        edge_widths = []
-
-        for _, _, data in graph.edges(data=True):
-            style = self.classify_edge(data.get("highway", "unclassified"))
-            edge_widths.append(style.core_width)
-
-        return edge_widths
+        core_widths = self.style.road_core_widths
+        return [
+            core_widths.get(
+                self._road_class(data.get("highway", "unclassified")), ROAD_WIDTH_DEFAULT
+            )
+            for _, _, data in graph.edges(data=True)
+        ]
 
     def _add_typography(
         self,
@@ -853,20 +947,9 @@ class PosterRenderer:
         return self.style.typography_tracking
 
     def _split_city_name(self, display_name: str) -> str:
-        r"""Split long city names into two balanced lines for visual appeal.
-
-        Names are split at word boundaries to create roughly equal line lengths.
-        The algorithm:
-        1. If single word, return uppercase unchanged
-        2. If total character count <= 14, return single line uppercase
-        3. Otherwise, split at the midpoint of total characters, respecting word boundaries
-        4. Move words from right to left until left side is >= half the total length
+        """Split long city names into two balanced lines for visual appeal.
 
-        Examples:
-            - "Paris" -> "PARIS"
-            - "New York" -> "NEW YORK"
-            - "Los Angeles" -> "LOS\nANGELES"
-            - "Rio de Janeiro" -> "RIO DE\nJANEIRO"
+        See the module-level ``_split_city_name``; results are cached per name.
 
         Args:
             display_name: The city name to potentially split.
@@ -874,26 +957,7 @@ class PosterRenderer:
         Returns:
             Uppercase city name, possibly with newline for two-line display.
         """
-        words = display_name.split()
-        if len(words) < 2:
-            return display_name.upper()
-        total_len = sum(len(word) for word in words)
-        if total_len <= 14:
-            return display_name.upper()
-
-        left_words: list[str] = []
-        right_words = words.copy()
-        left_len = 0
-        while right_words and left_len < total_len / 2:
-            word = right_words.pop(0)
-            left_words.append(word)
-            left_len += len(word)
-
-        left = " ".join(left_words).strip()
-        right = " ".join(right_words).strip()
-        if not right:
-            return display_name.upper()
-        return f"{left.upper()}\n{right.upper()}"
+        return _split_city_name(display_name)
 
     def _apply_tracking(self, text: str, tracking: int) -> str:
         r"""Apply character tracking (letter-spacing) to text.
@@ -913,12 +977,10 @@ class PosterRenderer:
         Returns:
             Text with tracking applied.
         """
+        if tracking <= 0:
+            return text
         spacer = " " * tracking
-        if "\n" not in text:
-            return spacer.join(list(text))
-        lines = text.split("\n")
-        spaced_lines = [spacer.join(list(line)) for line in lines]
-        return "\n".join(spaced_lines)
+        return "\n".join(spacer.join(line) for line in text.split("\n"))
 
     def build_layers(
         self,
@@ -1137,28 +1199,19 @@ class PosterRenderer:
             logger.warning("No road data available for rendering.")
             return layers, crop_xlim, crop_ylim
         edges_gdf = edges_gdf.copy()
-        edges_gdf["road_class"] = (
-            edges_gdf["highway"]
-            .map(self._normalize_highway)
-            .map(HIGHWAY_CLASS_MAP)
-            .fillna("default")
+        # Categorical codes let a single groupby pass split the edges by class
+        edges_gdf["road_class"] = pd.Categorical(
+            self._road_classes(edges_gdf["highway"]), categories=_ROAD_CLASS_ORDER
         )
+        class_positions = edges_gdf.groupby("road_class", observed=True).indices
 
-        class_order = [
-            "path",  # Footpaths rendered first (below all roads)
-            "default",
-            "residential",
-            "tertiary",
-            "secondary",
-            "primary",
-            "motorway",
-        ]
-        for index, road_class in enumerate(class_order):
-            class_edges = edges_gdf[edges_gdf["road_class"] == road_class]
-            if class_edges.empty:
+        for index, road_class in enumerate(_ROAD_CLASS_ORDER):
+            positions = class_positions.get(road_class)
+            if positions is None:
                 continue
 
-            style = self.classify_edge(class_edges.iloc[0].get("highway"))
+            class_edges = edges_gdf.take(positions)
+            style = self._road_style(road_class)
             casing_zorder = ZOrder.ROADS + index * 2
             core_zorder = ZOrder.ROADS + index * 2 + 1
 
@@ -1256,7 +1309,7 @@ class PosterRenderer:
                 "or pip install datashader"
             )
 
-        for layer in sorted(layers, key=lambda item: item.zorder):
+        for layer in sorted(layers, key=_BY_ZORDER):
             if layer.gdf is not None:
                 if "linewidth" in layer.style:
                     plot_kwargs: dict[str, Any] = {
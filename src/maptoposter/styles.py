@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
-from dataclasses import fields as dataclass_fields
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from ._json import loads as json_loads
 from .render_constants import (
     ATTRIBUTION_X_POS,
     ATTRIBUTION_Y_POS,
@@ -26,6 +26,10 @@ from .render_constants import (
 )
 
 
+if TYPE_CHECKING:
+    import os
+
+
 __all__ = [
     "StyleConfig",
     "get_available_presets",
@@ -35,7 +39,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleConfig:
     """Styling configuration for rendering."""
 
@@ -74,6 +78,7 @@ class StyleConfig:
     attribution_y_pos: float = ATTRIBUTION_Y_POS
     texture_strength: float = 0.0
     grain_strength: float = 0.0
+    grain_coarseness: int = 1
     vignette_strength: float = 0.0
     color_grading_strength: float = 0.0
     paper_texture_path: str | None = None
@@ -81,6 +86,13 @@ class StyleConfig:
     enable_layer_cache: bool = False
 
 
+# Keys a style pack may set; the slotted dataclass lists one slot per field
+_STYLE_PACK_KEYS = frozenset(StyleConfig.__slots__)
+
+# Allowed grain coarseness factors, as in docs/style-pack.schema.json
+_GRAIN_COARSENESS_RANGE = range(1, 17)
+
+
 PRESET_STYLES: dict[str, tuple[StyleConfig, str]] = {
     "noir": (
         StyleConfig(
@@ -158,33 +170,56 @@ PRESET_STYLES: dict[str, tuple[StyleConfig, str]] = {
 }
 
 
+# Preset names are fixed at import time, so sort them once
+_PRESET_NAMES = tuple(sorted(PRESET_STYLES))
+
+
 def get_available_presets() -> list[str]:
     """Return available style preset names."""
-    return sorted(PRESET_STYLES.keys())
+    return list(_PRESET_NAMES)
 
 
 def get_preset_description(preset_name: str) -> str:
     """Return the description for a preset name."""
-    if preset_name not in PRESET_STYLES:
-        raise KeyError(f"Unknown preset '{preset_name}'.")
-    return PRESET_STYLES[preset_name][1]
+    try:
+        return PRESET_STYLES[preset_name][1]
+    except KeyError:
+        raise KeyError(f"Unknown preset '{preset_name}'.") from None
 
 
 def get_style_preset(preset_name: str) -> StyleConfig:
     """Return the style configuration for a preset name."""
-    if preset_name not in PRESET_STYLES:
-        raise KeyError(f"Unknown preset '{preset_name}'.")
-    return PRESET_STYLES[preset_name][0]
+    try:
+        return PRESET_STYLES[preset_name][0]
+    except KeyError:
+        raise KeyError(f"Unknown preset '{preset_name}'.") from None
 
 
-def load_style_pack(path: str) -> StyleConfig:
+def load_style_pack(path: str | os.PathLike[str]) -> StyleConfig:
     """Load a StyleConfig from a JSON style pack file."""
-    with Path(path).open(encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json_loads(Path(path).read_bytes())
     if not isinstance(data, dict):
         raise ValueError("Style pack must be a JSON object.")
-    allowed_keys = {field.name for field in dataclass_fields(StyleConfig)}
-    unknown_keys = set(data) - allowed_keys
+    unknown_keys = data.keys() - _STYLE_PACK_KEYS
     if unknown_keys:
         raise ValueError(f"Unknown style pack keys: {sorted(unknown_keys)}")
+    if "grain_coarseness" in data:
+        data["grain_coarseness"] = _parse_grain_coarseness(data["grain_coarseness"])
     return StyleConfig(**data)
+
+
+def _parse_grain_coarseness(value: object) -> int:
+    """Return a style pack's grain coarseness as an int, or raise ValueError.
+
+    Integral floats such as ``2.0`` are accepted; anything else outside the
+    integers 1-16 is rejected here rather than failing later during rendering.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, int)
+        or value not in _GRAIN_COARSENESS_RANGE
+    ):
+        raise ValueError(f"grain_coarseness must be an integer from 1 to 16, got {value!r}.")
+    return value
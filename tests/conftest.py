@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def fake_font_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create placeholder bold/regular/light font files once per session."""
+    font_dir = tmp_path_factory.mktemp("fonts")
+    for name in ["bold.ttf", "regular.ttf", "light.ttf"]:
+        (font_dir / name).write_bytes(b"fake font data")
+    return font_dir
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import pytest
+
 from maptoposter.cli import _parse_batch_file, cli, create_parser
 
 
@@ -66,88 +68,67 @@ class TestCLI:
 class TestParser:
     """Tests for argument parser."""
 
-    def test_parser_defaults(self) -> None:
-        """Test parser default values."""
-        parser = create_parser()
-        args = parser.parse_args(["--city", "Paris", "--country", "France"])
-        assert args.theme == "feature_based"
-        assert args.preset is None
-        assert args.style_pack is None
-        assert args.render_backend == "matplotlib"
-        assert args.distance == 12000  # Safe default for most cities
-        assert args.width == 12.0
-        assert args.height == 16.0
-        assert args.format == "png"
-
-    def test_parser_custom_values(self) -> None:
-        """Test parser with custom values."""
-        parser = create_parser()
-        args = parser.parse_args(
-            [
-                "-c",
-                "Tokyo",
-                "-C",
-                "Japan",
-                "-t",
-                "noir",
-                "-d",
-                "15000",
-                "-W",
-                "18",
-                "-H",
-                "24",
-                "-f",
-                "svg",
-            ]
-        )
-        assert args.city == "Tokyo"
-        assert args.country == "Japan"
-        assert args.theme == "noir"
-        assert args.distance == 15000
-        assert args.width == 18.0
-        assert args.height == 24.0
-        assert args.format == "svg"
-
-    def test_parser_preset_value(self) -> None:
-        """Test parser with preset value."""
-        parser = create_parser()
-        args = parser.parse_args(
-            [
-                "--city",
-                "Paris",
-                "--country",
-                "France",
-                "--preset",
-                "noir",
-            ]
-        )
-        assert args.preset == "noir"
-
-    def test_parser_all_themes_flag(self) -> None:
-        """Test --all-themes flag."""
-        parser = create_parser()
-        args = parser.parse_args(
-            [
-                "--city",
-                "Paris",
-                "--country",
-                "France",
-                "--all-themes",
-            ]
-        )
-        assert args.all_themes is True
-
-    def test_parser_batch_flag(self) -> None:
-        """Test --batch flag."""
-        parser = create_parser()
-        args = parser.parse_args(["--batch", "cities.txt"])
-        assert args.batch == "cities.txt"
-
-    def test_parser_workers_flag(self) -> None:
-        """Test --workers flag."""
-        parser = create_parser()
-        args = parser.parse_args(["--batch", "cities.txt", "--workers", "8"])
-        assert args.workers == 8
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (
+                ["--city", "Paris", "--country", "France"],
+                {
+                    "theme": "feature_based",
+                    "preset": None,
+                    "style_pack": None,
+                    "render_backend": "matplotlib",
+                    "distance": 12000,  # Safe default for most cities
+                    "width": 12.0,
+                    "height": 16.0,
+                    "format": "png",
+                },
+            ),
+            (
+                [
+                    "-c",
+                    "Tokyo",
+                    "-C",
+                    "Japan",
+                    "-t",
+                    "noir",
+                    "-d",
+                    "15000",
+                    "-W",
+                    "18",
+                    "-H",
+                    "24",
+                    "-f",
+                    "svg",
+                ],
+                {
+                    "city": "Tokyo",
+                    "country": "Japan",
+                    "theme": "noir",
+                    "distance": 15000,
+                    "width": 18.0,
+                    "height": 24.0,
+                    "format": "svg",
+                },
+            ),
+            (
+                ["--city", "Paris", "--country", "France", "--preset", "noir"],
+                {"preset": "noir"},
+            ),
+            (
+                ["--city", "Paris", "--country", "France", "--all-themes"],
+                {"all_themes": True},
+            ),
+            (["--batch", "cities.txt"], {"batch": "cities.txt"}),
+            (["--batch", "cities.txt", "--workers", "8"], {"workers": 8}),
+        ],
+        ids=["defaults", "custom", "preset", "all-themes", "batch", "workers"],
+    )
+    def test_parser_variants(self, argv: list[str], expected: dict[str, object]) -> None:
+        """Test parsed values for common argument combinations."""
+        args = create_parser().parse_args(argv)
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
 class TestBatchProcessing:
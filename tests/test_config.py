@@ -32,6 +32,12 @@ class TestThemes:
         assert "text" in theme
         assert "road_motorway" in theme
 
+    def test_load_theme_returns_independent_copies(self) -> None:
+        """Test that modifying a loaded theme does not affect later loads."""
+        theme = load_theme("feature_based")
+        theme["bg"] = "#123456"
+        assert load_theme("feature_based")["bg"] != "#123456"
+
     def test_load_nonexistent_theme_falls_back(self) -> None:
         """Test that loading nonexistent theme returns default."""
         theme = load_theme("nonexistent_theme_xyz")
@@ -106,8 +112,10 @@ class TestAllThemesParametric:
     def test_theme_has_required_keys(self, theme_name: str) -> None:
         """Test that each theme has all required keys."""
         theme = load_theme(theme_name)
-        missing = REQUIRED_THEME_KEYS - theme.keys()
-        assert not missing, f"Theme {theme_name} missing keys: {missing}"
+        # Only build the difference set for the failure message
+        if len(REQUIRED_THEME_KEYS & theme.keys()) != len(REQUIRED_THEME_KEYS):
+            missing = REQUIRED_THEME_KEYS - theme.keys()
+            pytest.fail(f"Theme {theme_name} missing keys: {missing}")
 
     @pytest.mark.parametrize("theme_name", get_available_themes())
     def test_theme_colors_are_valid(self, theme_name: str) -> None:
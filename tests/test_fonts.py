@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 from matplotlib.font_manager import FontProperties
 
-from maptoposter.fonts import FontSet, load_fonts
+from maptoposter.fonts import _PROPERTIES_CACHE_SIZE, FontSet, load_fonts
 
 
 if TYPE_CHECKING:
@@ -17,16 +17,12 @@ if TYPE_CHECKING:
 class TestFontSet:
     """Tests for FontSet class."""
 
-    def test_font_set_is_loaded_all_present(self, tmp_path: Path) -> None:
+    def test_font_set_is_loaded_all_present(self, fake_font_dir: Path) -> None:
         """Test is_loaded returns True when all fonts exist."""
-        # Create mock font files
-        for name in ["bold.ttf", "regular.ttf", "light.ttf"]:
-            (tmp_path / name).touch()
-
         font_set = FontSet(
-            bold=tmp_path / "bold.ttf",
-            regular=tmp_path / "regular.ttf",
-            light=tmp_path / "light.ttf",
+            bold=fake_font_dir / "bold.ttf",
+            regular=fake_font_dir / "regular.ttf",
+            light=fake_font_dir / "light.ttf",
         )
         assert font_set.is_loaded is True
 
@@ -52,24 +48,17 @@ class TestFontSet:
 class TestGetProperties:
     """Tests for FontSet.get_properties method."""
 
-    def test_get_properties_with_existing_font(self, tmp_path: Path) -> None:
+    def test_get_properties_with_existing_font(self, fake_font_dir: Path) -> None:
         """Test get_properties returns FontProperties with correct font."""
-        # Create a mock font file
-        font_file = tmp_path / "regular.ttf"
-        font_file.write_bytes(b"fake font data")
-
-        font_set = FontSet(regular=font_file)
+        font_set = FontSet(regular=fake_font_dir / "regular.ttf")
         props = font_set.get_properties("regular", 14.0)
 
         assert isinstance(props, FontProperties)
         assert props.get_size() == 14.0
 
-    def test_get_properties_fallback_to_regular(self, tmp_path: Path) -> None:
+    def test_get_properties_fallback_to_regular(self, fake_font_dir: Path) -> None:
         """Test get_properties falls back to regular when weight not found."""
-        font_file = tmp_path / "regular.ttf"
-        font_file.write_bytes(b"fake font data")
-
-        font_set = FontSet(regular=font_file, bold=None, light=None)
+        font_set = FontSet(regular=fake_font_dir / "regular.ttf", bold=None, light=None)
         # Request bold, but it's None, should fall back to regular
         props = font_set.get_properties("bold", 12.0)
 
@@ -108,6 +97,26 @@ class TestGetProperties:
 
         assert props.get_weight() == "light"
 
+    def test_get_properties_is_cached_per_weight_and_size(self) -> None:
+        """Test repeated lookups reuse the same FontProperties instance."""
+        font_set = FontSet(bold=None, regular=None, light=None)
+
+        first = font_set.get_properties("bold", 12.0)
+        assert font_set.get_properties("bold", 12.0) is first
+        assert font_set.get_properties("bold", 14.0) is not first
+        assert font_set.get_properties("light", 12.0) is not first
+
+    def test_get_properties_cache_is_bounded(self) -> None:
+        """Test the properties cache evicts the least recently used sizes."""
+        font_set = FontSet(bold=None, regular=None, light=None)
+
+        first = font_set.get_properties("regular", 1.0)
+        for size in range(2, _PROPERTIES_CACHE_SIZE + 2):
+            font_set.get_properties("regular", float(size))
+
+        assert len(font_set._properties_cache) == _PROPERTIES_CACHE_SIZE
+        assert font_set.get_properties("regular", 1.0) is not first
+
 
 class TestLoadFonts:
     """Tests for load_fonts function."""
@@ -130,6 +139,10 @@ class TestLoadFonts:
         if fonts.light is not None:
             assert fonts.light.name == "Roboto-Light.ttf"
 
+    def test_load_fonts_is_cached_per_directory(self) -> None:
+        """Test repeated loads from the same directory share one FontSet."""
+        assert load_fonts() is load_fonts()
+
     def test_load_fonts_with_missing_directory(self, tmp_path: Path) -> None:
         """Test load_fonts handles missing fonts directory gracefully."""
         with patch("maptoposter.fonts.get_fonts_dir", return_value=tmp_path / "nonexistent"):
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from geopy.exc import GeocoderTimedOut
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError, Timeout
 
+import maptoposter.geo as _geo
 from maptoposter.geo import (
     GeocodingError,
     OSMFetchError,
+    _tags_cache_key,
     fetch_features,
     fetch_graph,
     get_coordinates,
@@ -21,388 +25,276 @@ from maptoposter.geo import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
+@dataclass
+class GeoEnv:
+    """Mocks installed over the network and cache dependencies of ``maptoposter.geo``."""
+
+    nominatim: MagicMock
+    geolocator: MagicMock
+    ox: MagicMock
+    cache_get: MagicMock
+    cache_set: MagicMock
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep() -> Iterator[None]:
+    """Skip the geo module's API rate-limit sleeps for every test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_geo, "sleep", lambda _seconds: None)
+        yield
+
+
+@pytest.fixture(scope="class")
+def cache_env(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Point ``MAPTOPOSTER_CACHE_DIR`` at one temporary directory per test class."""
+    cache_dir = tmp_path_factory.mktemp("geo_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MAPTOPOSTER_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture
+def geo_env(monkeypatch: pytest.MonkeyPatch, cache_env: Path) -> GeoEnv:
+    """Isolate ``maptoposter.geo`` from the network and the cache.
+
+    The cache starts empty (``cache_get`` returns None) and writes succeed. Tests
+    configure ``return_value``/``side_effect`` on the exposed mocks as needed.
+    """
+    env = GeoEnv(
+        nominatim=MagicMock(),
+        geolocator=MagicMock(),
+        ox=MagicMock(),
+        cache_get=MagicMock(return_value=None),
+        cache_set=MagicMock(return_value=True),
+    )
+    env.nominatim.return_value = env.geolocator
+
+    monkeypatch.setattr(_geo, "Nominatim", env.nominatim)
+    monkeypatch.setattr(_geo, "ox", env.ox)
+    monkeypatch.setattr(_geo, "cache_get", env.cache_get)
+    monkeypatch.setattr(_geo, "cache_set", env.cache_set)
+    return env
+
+
+class InsufficientResponseError(Exception):
+    """Stand-in for osmnx's error when a query returns no data."""
+
+
+def _rate_limit_error() -> HTTPError:
+    """Build an HTTPError carrying a 429 response."""
+    http_error = HTTPError()
+    http_error.response = SimpleNamespace(status_code=429)
+    return http_error
+
+
 class TestGetCoordinates:
     """Tests for get_coordinates function."""
 
-    def test_successful_geocoding(self, tmp_path: Path) -> None:
+    def test_successful_geocoding(self, geo_env: GeoEnv) -> None:
         """Test successful geocoding returns coordinates."""
         mock_location = MagicMock()
         mock_location.latitude = 51.5074
         mock_location.longitude = -0.1278
         mock_location.address = "London, Greater London, England, UK"
+        geo_env.geolocator.geocode.return_value = mock_location
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.cache_set", return_value=True),
-            patch("maptoposter.geo.time.sleep"),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.return_value = mock_location
-            mock_nominatim.return_value = mock_geolocator
+        result = get_coordinates("London", "UK")
 
-            result = get_coordinates("London", "UK")
+        assert result == (51.5074, -0.1278)
+        geo_env.geolocator.geocode.assert_called_once_with("London, UK")
 
-            assert result == (51.5074, -0.1278)
-            mock_geolocator.geocode.assert_called_once_with("London, UK")
-
-    def test_uses_cached_coordinates(self, tmp_path: Path) -> None:
+    def test_uses_cached_coordinates(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that cached coordinates are returned without API call."""
         cached_coords = (40.7128, -74.0060)
+        monkeypatch.setattr("maptoposter.geo.cache_get", lambda *_: cached_coords)
+        # Any attempt to construct a geocoder would raise TypeError
+        monkeypatch.setattr("maptoposter.geo.Nominatim", None)
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=cached_coords),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-        ):
-            result = get_coordinates("New York", "USA")
+        result = get_coordinates("New York", "USA")
 
-            assert result == cached_coords
-            mock_nominatim.assert_not_called()
+        assert result == cached_coords
 
-    def test_raises_on_location_not_found(self, tmp_path: Path) -> None:
+    def test_raises_on_location_not_found(self, geo_env: GeoEnv) -> None:
         """Test that GeocodingError is raised when location not found."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.return_value = None
-            mock_nominatim.return_value = mock_geolocator
-
-            with pytest.raises(GeocodingError, match="Could not find coordinates"):
-                get_coordinates("NonexistentCity", "FakeCountry")
-
-    def test_raises_on_network_timeout(self, tmp_path: Path) -> None:
-        """Test that GeocodingError is raised on network timeout."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.side_effect = Timeout("Connection timed out")
-            mock_nominatim.return_value = mock_geolocator
-
-            with pytest.raises(GeocodingError, match="Network error"):
-                get_coordinates("Tokyo", "Japan")
-
-    def test_raises_on_connection_error(self, tmp_path: Path) -> None:
-        """Test that GeocodingError is raised on connection error."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.side_effect = RequestsConnectionError("No connection")
-            mock_nominatim.return_value = mock_geolocator
-
-            with pytest.raises(GeocodingError, match="Network error"):
-                get_coordinates("Paris", "France")
-
-    def test_raises_on_unexpected_error(self, tmp_path: Path) -> None:
-        """Test that GeocodingError is raised on unexpected geocoding errors."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.side_effect = GeocoderTimedOut("Service unavailable")
-            mock_nominatim.return_value = mock_geolocator
-
-            with pytest.raises(GeocodingError, match="Geocoding failed"):
-                get_coordinates("Berlin", "Germany")
-
-    def test_caches_result_after_successful_lookup(self, tmp_path: Path) -> None:
+        geo_env.geolocator.geocode.return_value = None
+
+        with pytest.raises(GeocodingError, match="Could not find coordinates"):
+            get_coordinates("NonexistentCity", "FakeCountry")
+
+    @pytest.mark.parametrize(
+        ("exc", "match"),
+        [
+            (Timeout("Connection timed out"), "Network error"),
+            (RequestsConnectionError("No connection"), "Network error"),
+            (GeocoderTimedOut("Service unavailable"), "Geocoding failed"),
+        ],
+        ids=["timeout", "connection-error", "unexpected-error"],
+    )
+    def test_raises_on_geocoding_error(self, geo_env: GeoEnv, exc: Exception, match: str) -> None:
+        """Test that geocoder failures are wrapped in GeocodingError."""
+        geo_env.geolocator.geocode.side_effect = exc
+
+        with pytest.raises(GeocodingError, match=match):
+            get_coordinates("Tokyo", "Japan")
+
+    def test_caches_result_after_successful_lookup(self, geo_env: GeoEnv) -> None:
         """Test that successful geocoding results are cached."""
         mock_location = MagicMock()
         mock_location.latitude = 48.8566
         mock_location.longitude = 2.3522
         mock_location.address = "Paris, France"
+        geo_env.geolocator.geocode.return_value = mock_location
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.Nominatim") as mock_nominatim,
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.cache_set") as mock_cache_set,
-            patch("maptoposter.geo.time.sleep"),
-        ):
-            mock_geolocator = MagicMock()
-            mock_geolocator.geocode.return_value = mock_location
-            mock_nominatim.return_value = mock_geolocator
-
-            get_coordinates("Paris", "France")
+        get_coordinates("Paris", "France")
 
-            mock_cache_set.assert_called_once()
-            call_args = mock_cache_set.call_args
-            assert call_args[0][0] == "coords_paris_france"
-            assert call_args[0][1] == (48.8566, 2.3522)
+        geo_env.cache_set.assert_called_once()
+        call_args = geo_env.cache_set.call_args
+        assert call_args[0][0] == "coords_paris_france"
+        assert call_args[0][1] == (48.8566, 2.3522)
 
 
 class TestFetchGraph:
     """Tests for fetch_graph function."""
 
-    def test_returns_cached_graph(self, tmp_path: Path) -> None:
+    def test_returns_cached_graph(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that cached graph is returned without API call."""
-        mock_graph = MagicMock()
+        cached_graph = object()
+        monkeypatch.setattr("maptoposter.geo.cache_get", lambda *_: cached_graph)
+        # Any attempt to reach osmnx would raise AttributeError
+        monkeypatch.setattr("maptoposter.geo.ox", None)
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=mock_graph),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            result = fetch_graph((51.5074, -0.1278), 5000.0)
+        result = fetch_graph((51.5074, -0.1278), 5000.0)
 
-            assert result is mock_graph
-            mock_ox.graph_from_point.assert_not_called()
+        assert result is cached_graph
 
-    def test_fetches_graph_on_cache_miss(self, tmp_path: Path) -> None:
+    def test_fetches_graph_on_cache_miss(self, geo_env: GeoEnv) -> None:
         """Test that graph is fetched from OSM on cache miss."""
         mock_graph = MagicMock()
-
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.cache_set", return_value=True),
-            patch("maptoposter.geo.ox") as mock_ox,
-            patch("maptoposter.geo.time.sleep"),
-        ):
-            mock_ox.graph_from_point.return_value = mock_graph
-
-            result = fetch_graph((51.5074, -0.1278), 5000.0)
-
-            assert result is mock_graph
-            mock_ox.graph_from_point.assert_called_once_with(
-                (51.5074, -0.1278),
-                dist=5000.0,
-                dist_type="bbox",
-                network_type="all",
-                truncate_by_edge=True,
-            )
-
-    def test_raises_on_network_timeout(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised on network timeout."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.graph_from_point.side_effect = Timeout("Request timed out")
-
-            with pytest.raises(OSMFetchError, match="Network error"):
-                fetch_graph((51.5074, -0.1278), 5000.0)
-
-    def test_raises_on_connection_error(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised on connection error."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.graph_from_point.side_effect = RequestsConnectionError("No connection")
-
-            with pytest.raises(OSMFetchError, match="Network error"):
-                fetch_graph((51.5074, -0.1278), 5000.0)
-
-    def test_raises_on_rate_limit(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised on HTTP 429 rate limit."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-
-        http_error = HTTPError()
-        http_error.response = mock_response
-
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.graph_from_point.side_effect = http_error
-
-            with pytest.raises(OSMFetchError, match="Rate limited"):
-                fetch_graph((51.5074, -0.1278), 5000.0)
-
-    def test_raises_on_empty_response(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised when no street data available."""
-
-        class InsufficientResponseError(Exception):
-            pass
-
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.graph_from_point.side_effect = InsufficientResponseError("No data")
-
-            with pytest.raises(OSMFetchError, match="No street data"):
-                fetch_graph((0.0, 0.0), 5000.0)
+        geo_env.ox.graph_from_point.return_value = mock_graph
+
+        result = fetch_graph((51.5074, -0.1278), 5000.0)
+
+        assert result is mock_graph
+        geo_env.ox.graph_from_point.assert_called_once_with(
+            (51.5074, -0.1278),
+            dist=5000.0,
+            dist_type="bbox",
+            network_type="all",
+            truncate_by_edge=True,
+        )
+
+    @pytest.mark.parametrize(
+        ("exc", "match"),
+        [
+            (Timeout("Request timed out"), "Network error"),
+            (RequestsConnectionError("No connection"), "Network error"),
+            (_rate_limit_error(), "Rate limited"),
+            (InsufficientResponseError("No data"), "No street data"),
+        ],
+        ids=["timeout", "connection-error", "rate-limit", "empty-response"],
+    )
+    def test_raises_on_fetch_error(self, geo_env: GeoEnv, exc: Exception, match: str) -> None:
+        """Test that OSM request failures are wrapped in OSMFetchError."""
+        geo_env.ox.graph_from_point.side_effect = exc
+
+        with pytest.raises(OSMFetchError, match=match):
+            fetch_graph((51.5074, -0.1278), 5000.0)
 
 
 class TestFetchFeatures:
     """Tests for fetch_features function."""
 
-    def test_returns_cached_features(self, tmp_path: Path) -> None:
+    def test_returns_cached_features(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that cached features are returned without API call."""
-        mock_gdf = MagicMock()
+        cached_gdf = object()
+        monkeypatch.setattr("maptoposter.geo.cache_get", lambda *_: cached_gdf)
+        # Any attempt to reach osmnx would raise AttributeError
+        monkeypatch.setattr("maptoposter.geo.ox", None)
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=mock_gdf),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            result = fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
+        result = fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
 
-            assert result is mock_gdf
-            mock_ox.features_from_point.assert_not_called()
+        assert result is cached_gdf
 
-    def test_fetches_features_on_cache_miss(self, tmp_path: Path) -> None:
+    def test_fetches_features_on_cache_miss(self, geo_env: GeoEnv) -> None:
         """Test that features are fetched from OSM on cache miss."""
         mock_gdf = MagicMock()
+        geo_env.ox.features_from_point.return_value = mock_gdf
 
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.cache_set", return_value=True),
-            patch("maptoposter.geo.ox") as mock_ox,
-            patch("maptoposter.geo.time.sleep"),
-        ):
-            mock_ox.features_from_point.return_value = mock_gdf
-
-            result = fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
-
-            assert result is mock_gdf
-            mock_ox.features_from_point.assert_called_once()
-
-    def test_raises_on_network_timeout(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised on network timeout."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.features_from_point.side_effect = Timeout("Request timed out")
-
-            with pytest.raises(OSMFetchError, match="Network error"):
-                fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
-
-    def test_raises_on_connection_error(self, tmp_path: Path) -> None:
-        """Test that OSMFetchError is raised on connection error."""
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None),
-            patch("maptoposter.geo.ox") as mock_ox,
-        ):
-            mock_ox.features_from_point.side_effect = RequestsConnectionError("No connection")
-
-            with pytest.raises(OSMFetchError, match="Network error"):
-                fetch_features((51.5074, -0.1278), 5000.0, {"leisure": "park"}, "parks")
-
-    def test_cache_key_includes_tags_hash(self, tmp_path: Path) -> None:
-        """Test that cache key changes when tags change."""
-        mock_gdf = MagicMock()
-
-        with (
-            patch.dict("os.environ", {"MAPTOPOSTER_CACHE_DIR": str(tmp_path)}),
-            patch("maptoposter.geo.cache_get", return_value=None) as mock_cache_get,
-            patch("maptoposter.geo.cache_set", return_value=True),
-            patch("maptoposter.geo.ox") as mock_ox,
-            patch("maptoposter.geo.time.sleep"),
-        ):
-            mock_ox.features_from_point.return_value = mock_gdf
-
-            # Fetch with water tags
-            fetch_features((51.5, -0.1), 5000.0, {"natural": "water"}, "features")
-
-            # Fetch with park tags (different tags)
-            fetch_features((51.5, -0.1), 5000.0, {"leisure": "park"}, "features")
-
-            # Should have been called with different cache keys
-            calls = mock_cache_get.call_args_list
-            assert len(calls) == 2
-            # Cache keys should be different due to tags hash
-            assert calls[0][0][0] != calls[1][0][0]
+        result = fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
 
+        assert result is mock_gdf
+        geo_env.ox.features_from_point.assert_called_once()
 
-class TestGetCropLimits:
-    """Tests for get_crop_limits function."""
+    @pytest.mark.parametrize(
+        ("exc", "match"),
+        [
+            (Timeout("Request timed out"), "Network error"),
+            (RequestsConnectionError("No connection"), "Network error"),
+        ],
+        ids=["timeout", "connection-error"],
+    )
+    def test_raises_on_fetch_error(self, geo_env: GeoEnv, exc: Exception, match: str) -> None:
+        """Test that OSM request failures are wrapped in OSMFetchError."""
+        geo_env.ox.features_from_point.side_effect = exc
 
-    def test_portrait_aspect_ratio(self) -> None:
-        """Test crop limits calculation for portrait aspect ratio."""
-        mock_graph = MagicMock()
-        mock_graph.graph = {"crs": "EPSG:32632"}
+        with pytest.raises(OSMFetchError, match=match):
+            fetch_features((51.5074, -0.1278), 5000.0, {"natural": "water"}, "water")
 
-        mock_fig = MagicMock()
-        mock_fig.get_size_inches.return_value = (8.0, 12.0)
+    def test_cache_key_includes_tags_hash(self) -> None:
+        """Test that the tags part of the cache key changes when tags change."""
+        water_key = _tags_cache_key({"natural": "water"})
 
-        mock_point = MagicMock()
-        mock_point.x = 500000.0
-        mock_point.y = 5500000.0
+        assert water_key != _tags_cache_key({"leisure": "park"})
+        # Key order must not affect the hash
+        assert _tags_cache_key({"a": "1", "b": "2"}) == _tags_cache_key({"b": "2", "a": "1"})
 
-        with patch("maptoposter.geo.ox.projection.project_geometry") as mock_project:
-            mock_project.return_value = (mock_point, None)
+    def test_cache_key_uses_tags_hash(self, geo_env: GeoEnv) -> None:
+        """Test that fetch_features looks up the cache with the tags hash."""
+        geo_env.cache_get.return_value = MagicMock()
 
-            xlim, ylim = get_crop_limits(mock_graph, (51.5074, -0.1278), mock_fig, 10000.0)
+        fetch_features((51.5, -0.1), 5000.0, {"natural": "water"}, "features")
 
-            # For portrait (8/12 = 0.67 < 1), width should be reduced
-            # half_y = 10000, half_x = 10000 * 0.67 = 6666.67
-            expected_half_x = 10000.0 * (8.0 / 12.0)
-            assert xlim[0] == pytest.approx(500000.0 - expected_half_x)
-            assert xlim[1] == pytest.approx(500000.0 + expected_half_x)
-            assert ylim[0] == pytest.approx(5500000.0 - 10000.0)
-            assert ylim[1] == pytest.approx(5500000.0 + 10000.0)
-
-    def test_landscape_aspect_ratio(self) -> None:
-        """Test crop limits calculation for landscape aspect ratio."""
-        mock_graph = MagicMock()
-        mock_graph.graph = {"crs": "EPSG:32632"}
+        cache_key = geo_env.cache_get.call_args[0][0]
+        assert cache_key.endswith(_tags_cache_key({"natural": "water"}))
 
-        mock_fig = MagicMock()
-        mock_fig.get_size_inches.return_value = (12.0, 8.0)
 
-        mock_point = MagicMock()
-        mock_point.x = 500000.0
-        mock_point.y = 5500000.0
+@pytest.fixture
+def mock_project(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Project any center point to a fixed UTM coordinate."""
+    center = SimpleNamespace(x=500000.0, y=5500000.0)
+    mock = MagicMock(return_value=(center, None))
+    monkeypatch.setattr("maptoposter.geo.ox.projection.project_geometry", mock)
+    return mock
 
-        with patch("maptoposter.geo.ox.projection.project_geometry") as mock_project:
-            mock_project.return_value = (mock_point, None)
 
-            xlim, ylim = get_crop_limits(mock_graph, (51.5074, -0.1278), mock_fig, 10000.0)
-
-            # For landscape (12/8 = 1.5 > 1), height should be reduced
-            # half_x = 10000, half_y = 10000 / 1.5 = 6666.67
-            expected_half_y = 10000.0 / (12.0 / 8.0)
-            assert xlim[0] == pytest.approx(500000.0 - 10000.0)
-            assert xlim[1] == pytest.approx(500000.0 + 10000.0)
-            assert ylim[0] == pytest.approx(5500000.0 - expected_half_y)
-            assert ylim[1] == pytest.approx(5500000.0 + expected_half_y)
-
-    def test_square_aspect_ratio(self) -> None:
-        """Test crop limits calculation for square aspect ratio."""
-        mock_graph = MagicMock()
-        mock_graph.graph = {"crs": "EPSG:32632"}
-
-        mock_fig = MagicMock()
-        mock_fig.get_size_inches.return_value = (10.0, 10.0)
-
-        mock_point = MagicMock()
-        mock_point.x = 500000.0
-        mock_point.y = 5500000.0
-
-        with patch("maptoposter.geo.ox.projection.project_geometry") as mock_project:
-            mock_project.return_value = (mock_point, None)
-
-            xlim, ylim = get_crop_limits(mock_graph, (51.5074, -0.1278), mock_fig, 10000.0)
+class TestGetCropLimits:
+    """Tests for get_crop_limits function."""
 
-            # For square (1:1), both dimensions should use full dist
-            assert xlim[0] == pytest.approx(500000.0 - 10000.0)
-            assert xlim[1] == pytest.approx(500000.0 + 10000.0)
-            assert ylim[0] == pytest.approx(5500000.0 - 10000.0)
-            assert ylim[1] == pytest.approx(5500000.0 + 10000.0)
+    @pytest.mark.parametrize(
+        ("size", "expected_half_x", "expected_half_y"),
+        [
+            # Portrait (8/12 < 1): width is reduced
+            ((8.0, 12.0), 10000.0 * (8.0 / 12.0), 10000.0),
+            # Landscape (12/8 > 1): height is reduced
+            ((12.0, 8.0), 10000.0, 10000.0 / (12.0 / 8.0)),
+            # Square (1:1): both dimensions use the full distance
+            ((10.0, 10.0), 10000.0, 10000.0),
+        ],
+        ids=["portrait", "landscape", "square"],
+    )
+    @pytest.mark.usefixtures("mock_project")
+    def test_aspect_ratio(
+        self, size: tuple[float, float], expected_half_x: float, expected_half_y: float
+    ) -> None:
+        """Test crop limits preserve the figure aspect ratio around the center."""
+        mock_graph = SimpleNamespace(graph={"crs": "EPSG:32632"})
+        mock_fig = SimpleNamespace(get_size_inches=lambda: size)
+
+        xlim, ylim = get_crop_limits(mock_graph, (51.5074, -0.1278), mock_fig, 10000.0)
+
+        assert xlim == pytest.approx((500000.0 - expected_half_x, 500000.0 + expected_half_x))
+        assert ylim == pytest.approx((5500000.0 - expected_half_y, 5500000.0 + expected_half_y))
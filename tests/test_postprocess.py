@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
@@ -10,16 +11,24 @@ from PIL import Image
 
 from maptoposter.postprocess import (
     PostProcessResult,
+    _fill_coarse_grain,
+    _load_texture,
+    _vignette_alpha,
     apply_raster_effects,
     needs_raster_postprocessing,
 )
 
 
-@dataclass
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
 class MockStyle:
     """Mock style object for testing RasterStyle protocol."""
 
     grain_strength: float = 0.0
+    grain_coarseness: int = 1
     vignette_strength: float = 0.0
     texture_strength: float = 0.0
     color_grading_strength: float = 0.0
@@ -27,62 +36,95 @@ class MockStyle:
     seed: int | None = None
 
 
+# Shared all-zero style; MockStyle is frozen so one instance can be reused
+_ZERO_STYLE = MockStyle()
+
+
+# Reference pixels for the default 100x100 solid gray test image
+_SOLID_GRAY_RGBA = np.full((100, 100, 4), 128, dtype=np.uint8)
+_SOLID_GRAY_RGBA[..., 3] = 255
+_SOLID_GRAY_RGBA.setflags(write=False)
+
+
 def create_test_image(width: int = 100, height: int = 100) -> Image.Image:
-    """Create a solid color test image."""
+    """Create a solid color test image.
+
+    The default size wraps the read-only ``_SOLID_GRAY_RGBA`` buffer instead of
+    allocating and filling new pixels; PIL copies it on first write.
+    """
+    if (width, height) == (100, 100):
+        return Image.frombuffer("RGBA", (100, 100), _SOLID_GRAY_RGBA, "raw", "RGBA", 0, 1)
     return Image.new("RGBA", (width, height), (128, 128, 128, 255))
 
 
-class TestNeedsRasterPostprocessing:
-    """Tests for needs_raster_postprocessing function."""
+def pixels_equal(a: Image.Image, b: Image.Image) -> bool:
+    """Compare two images pixel-for-pixel via their raw buffers."""
+    return a.mode == b.mode and a.size == b.size and a.tobytes() == b.tobytes()
+
 
-    def test_returns_false_for_non_png_format(self) -> None:
-        """Non-PNG formats should never need postprocessing."""
-        style = MockStyle(grain_strength=1.0)
-        assert needs_raster_postprocessing("svg", style) is False
-        assert needs_raster_postprocessing("pdf", style) is False
-        assert needs_raster_postprocessing("jpg", style) is False
+@pytest.fixture(scope="module")
+def base_image() -> Image.Image:
+    """Shared 100x100 test image; effects return new images, so it is never mutated."""
+    return create_test_image()
 
-    def test_returns_false_when_all_strengths_zero(self) -> None:
-        """PNG with no effects should not need postprocessing."""
-        style = MockStyle()
-        assert needs_raster_postprocessing("png", style) is False
 
-    def test_returns_true_when_grain_strength_positive(self) -> None:
-        """PNG with grain should need postprocessing."""
-        style = MockStyle(grain_strength=0.1)
-        assert needs_raster_postprocessing("png", style) is True
+@pytest.fixture(scope="module")
+def effect_results(base_image: Image.Image) -> dict[str, PostProcessResult]:
+    """Results of applying each single effect (and none) to ``base_image``, computed once."""
+    return {
+        "grain": apply_raster_effects(base_image, MockStyle(grain_strength=0.5, seed=42)),
+        "vignette": apply_raster_effects(base_image, MockStyle(vignette_strength=0.5)),
+        "color_grading": apply_raster_effects(base_image, MockStyle(color_grading_strength=0.5)),
+        "none": apply_raster_effects(base_image, _ZERO_STYLE),
+    }
 
-    def test_returns_true_when_vignette_strength_positive(self) -> None:
-        """PNG with vignette should need postprocessing."""
-        style = MockStyle(vignette_strength=0.1)
-        assert needs_raster_postprocessing("png", style) is True
 
-    def test_returns_true_when_texture_strength_positive(self) -> None:
-        """PNG with texture should need postprocessing."""
-        style = MockStyle(texture_strength=0.1)
-        assert needs_raster_postprocessing("png", style) is True
+class TestNeedsRasterPostprocessing:
+    """Tests for needs_raster_postprocessing function."""
 
-    def test_returns_true_when_color_grading_strength_positive(self) -> None:
-        """PNG with color grading should need postprocessing."""
-        style = MockStyle(color_grading_strength=0.1)
-        assert needs_raster_postprocessing("png", style) is True
+    @pytest.mark.parametrize(
+        ("fmt", "style", "expected"),
+        [
+            # Non-PNG formats should never need postprocessing
+            ("svg", MockStyle(grain_strength=1.0), False),
+            ("pdf", MockStyle(grain_strength=1.0), False),
+            ("jpg", MockStyle(grain_strength=1.0), False),
+            # PNG with no effects should not need postprocessing
+            ("png", _ZERO_STYLE, False),
+            # PNG with any positive effect strength should need postprocessing
+            ("png", MockStyle(grain_strength=0.1), True),
+            ("png", MockStyle(vignette_strength=0.1), True),
+            ("png", MockStyle(texture_strength=0.1), True),
+            ("png", MockStyle(color_grading_strength=0.1), True),
+        ],
+        ids=[
+            "svg",
+            "pdf",
+            "jpg",
+            "png-no-effects",
+            "png-grain",
+            "png-vignette",
+            "png-texture",
+            "png-color-grading",
+        ],
+    )
+    def test_needs_raster_postprocessing(self, fmt: str, style: MockStyle, expected: bool) -> None:
+        """Test whether post-processing runs for each format and effect combination."""
+        assert needs_raster_postprocessing(fmt, style) is expected
 
 
 class TestApplyRasterEffects:
     """Tests for apply_raster_effects function."""
 
-    def test_returns_post_process_result(self) -> None:
+    def test_returns_post_process_result(self, base_image: Image.Image) -> None:
         """Result should be a PostProcessResult instance."""
-        image = create_test_image()
-        style = MockStyle()
-        result = apply_raster_effects(image, style)
+        result = apply_raster_effects(base_image, _ZERO_STYLE)
         assert isinstance(result, PostProcessResult)
 
     def test_returns_rgba_image(self) -> None:
         """Result image should always be RGBA mode."""
         image = Image.new("RGB", (50, 50), (100, 100, 100))
-        style = MockStyle()
-        result = apply_raster_effects(image, style)
+        result = apply_raster_effects(image, _ZERO_STYLE)
         assert result.image.mode == "RGBA"
 
     def test_preserves_image_size(self) -> None:
@@ -92,39 +134,133 @@ class TestApplyRasterEffects:
         result = apply_raster_effects(image, style)
         assert result.image.size == (120, 80)
 
-    def test_grain_modifies_image(self) -> None:
+    def test_grain_modifies_image(
+        self, base_image: Image.Image, effect_results: dict[str, PostProcessResult]
+    ) -> None:
         """Grain effect should modify pixel values."""
-        image = create_test_image()
-        style = MockStyle(grain_strength=0.5, seed=42)
-        result = apply_raster_effects(image, style)
-
-        original_arr = np.array(image)
-        result_arr = np.array(result.image)
         # Images should differ due to grain noise
-        assert not np.array_equal(original_arr, result_arr)
+        assert not pixels_equal(base_image, effect_results["grain"].image)
 
-    def test_grain_is_reproducible_with_seed(self) -> None:
+    def test_grain_is_reproducible_with_seed(self, base_image: Image.Image) -> None:
         """Same seed should produce identical grain results."""
-        image = create_test_image()
         style = MockStyle(grain_strength=0.3, seed=12345)
 
-        result1 = apply_raster_effects(image.copy(), style)
-        result2 = apply_raster_effects(image.copy(), style)
+        result1 = apply_raster_effects(base_image.copy(), style)
+        result2 = apply_raster_effects(base_image.copy(), style)
 
-        assert np.array_equal(np.array(result1.image), np.array(result2.image))
+        assert pixels_equal(result1.image, result2.image)
 
-    def test_vignette_darkens_edges(self) -> None:
-        """Vignette should make edges darker than center."""
-        image = create_test_image(100, 100)
-        style = MockStyle(vignette_strength=0.5)
-        result = apply_raster_effects(image, style)
+    def test_banded_grain_is_reproducible_with_seed(self) -> None:
+        """Grain spanning several row bands should still be identical per seed."""
+        image = create_test_image(64, 600)
+        style = MockStyle(grain_strength=0.3, seed=2024)
+
+        result1 = apply_raster_effects(image, style)
+        result2 = apply_raster_effects(image, style)
+
+        assert pixels_equal(result1.image, result2.image)
+
+    def test_large_image_grain_is_reproducible_with_seed(
+        self, base_image: Image.Image, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The large-image grain path (Numba when installed) should be identical per seed."""
+        monkeypatch.setattr("maptoposter.postprocess._NUMBA_GRAIN_MIN_BYTES", 0)
+        style = MockStyle(grain_strength=0.3, seed=12345)
+
+        result1 = apply_raster_effects(base_image, style)
+        result2 = apply_raster_effects(base_image, style)
+
+        assert pixels_equal(result1.image, result2.image)
+        assert not pixels_equal(base_image, result1.image)
+
+    def test_numba_grain_kernel_is_deterministic_per_seed(self) -> None:
+        """The parallel Numba kernel should fill rows identically for the same seeds."""
+        pytest.importorskip("numba")
+        from maptoposter._grain_kernel import fill_grain
+
+        def fill(seed: int) -> np.ndarray:
+            overlay = np.zeros((300, 64, 4), dtype=np.uint8)
+            fill_grain(overlay, 0.3, np.random.SeedSequence(seed).generate_state(300))
+            return overlay
 
-        result_arr = np.array(result.image)
-        # Check that corners are darker than center
-        center_brightness = np.mean(result_arr[45:55, 45:55, :3])
-        corner_brightness = np.mean(result_arr[0:10, 0:10, :3])
+        np.testing.assert_array_equal(fill(1), fill(1))
+        assert not np.array_equal(fill(1), fill(2))
+
+    def test_coarse_grain_is_reproducible_with_seed(self, base_image: Image.Image) -> None:
+        """Upsampled value-noise grain should be identical per seed and differ from fine grain."""
+        coarse = MockStyle(grain_strength=0.3, grain_coarseness=4, seed=12345)
+
+        result1 = apply_raster_effects(base_image, coarse)
+        result2 = apply_raster_effects(base_image, coarse)
+        fine = apply_raster_effects(base_image, MockStyle(grain_strength=0.3, seed=12345))
+
+        assert pixels_equal(result1.image, result2.image)
+        assert not pixels_equal(base_image, result1.image)
+        assert not pixels_equal(fine.image, result1.image)
+
+    def test_coarse_grain_bands_match_full_frame_upsample(self) -> None:
+        """Banded upsampling should match one full-frame resize without seams."""
+        height, width, coarseness, strength = 600, 90, 4, 0.3
+        overlay = np.zeros((height, width, 4), dtype=np.uint8)
+        _fill_coarse_grain(overlay, np.random.SeedSequence(5), strength, coarseness)
+
+        rng = np.random.default_rng(np.random.SeedSequence(5))
+        low_res = rng.standard_normal(
+            (-(-height // coarseness), -(-width // coarseness)), np.float32
+        )
+        upsampled = Image.fromarray(low_res, mode="F").resize(
+            (width, height), Image.Resampling.BILINEAR
+        )
+        expected = np.clip(np.asarray(upsampled) * (255 * strength) + 128, 0, 255)
+        diff = np.abs(overlay[..., 0].astype(np.int16) - expected.astype(np.uint8))
+        assert diff.max() <= 1
+
+    def test_grain_leaves_global_rng_untouched(self, base_image: Image.Image) -> None:
+        """Grain should draw from its own generator, not NumPy's global state."""
+        state = np.random.get_state()
+        apply_raster_effects(base_image, MockStyle(grain_strength=0.3, seed=7))
+        after = np.random.get_state()
+        assert np.array_equal(state[1], after[1])
+        assert state[2] == after[2]
+
+    def test_vignette_darkens_edges(self, effect_results: dict[str, PostProcessResult]) -> None:
+        """Vignette should make edges darker than center."""
+        result_arr = np.asarray(effect_results["vignette"].image)
+        # Check that corners are darker than center; both regions have the same
+        # number of pixels, so comparing integer sums is equivalent to comparing means
+        center_brightness = int(result_arr[45:55, 45:55, :3].sum(dtype=np.int64))
+        corner_brightness = int(result_arr[0:10, 0:10, :3].sum(dtype=np.int64))
         assert corner_brightness < center_brightness
 
+    def test_vignette_mask_is_cached_per_size_and_strength(self) -> None:
+        """Repeated vignettes at the same size and strength reuse one mask."""
+        mask = _vignette_alpha(100, 100, 0.5)
+        assert _vignette_alpha(100, 100, 0.5) is mask
+        assert _vignette_alpha(120, 80, 0.5) is not mask
+        # Shared between calls, so it must not be writable
+        assert not mask.flags.writeable
+
+    def test_vignette_mask_matches_full_frame_formula(self) -> None:
+        """The banded mask should equal the full-frame meshgrid computation exactly."""
+        width, height, strength = 300, 700, 0.3
+        xv, yv = np.meshgrid(np.linspace(-1, 1, width), np.linspace(-1, 1, height))
+        mask = np.clip(1 - (xv**2 + yv**2), 0, 1)
+        mask = (mask**1.5) * (1 - strength * 0.1) + strength * 0.1 * mask
+        expected = 255 - (mask * 255).astype(np.uint8)
+        np.testing.assert_array_equal(_vignette_alpha(width, height, strength), expected)
+
+    def test_texture_blends_cached_texture(self, base_image: Image.Image, tmp_path: Path) -> None:
+        """Texture should be composited, and the decoded file reused across calls."""
+        texture_path = tmp_path / "paper.png"
+        Image.new("RGBA", (40, 40), (255, 240, 200, 255)).save(texture_path)
+        style = MockStyle(texture_strength=0.5, paper_texture_path=str(texture_path))
+
+        result = apply_raster_effects(base_image, style)
+
+        assert result.effects_applied == ("texture",)
+        assert not pixels_equal(base_image, result.image)
+        assert _load_texture(str(texture_path)) is _load_texture(str(texture_path))
+
     def test_color_grading_enhances_image(self) -> None:
         """Color grading should change color/contrast."""
         # Use an image with some color variation
@@ -132,109 +268,85 @@ class TestApplyRasterEffects:
         style = MockStyle(color_grading_strength=0.5)
         result = apply_raster_effects(image, style)
 
-        original_arr = np.array(image)
-        result_arr = np.array(result.image)
-        assert not np.array_equal(original_arr, result_arr)
+        assert not pixels_equal(image, result.image)
 
     def test_no_effects_returns_unchanged_pixels(self) -> None:
-        """With all effects at zero, pixels should be unchanged."""
-        image = create_test_image()
-        style = MockStyle()  # All zeros
-        result = apply_raster_effects(image, style)
+        """With all effects at zero, an RGB input should only gain an opaque alpha channel."""
+        image = Image.new("RGB", (30, 20), (10, 120, 230))
+        expected = np.empty((20, 30, 4), dtype=np.uint8)
+        expected[...] = (10, 120, 230, 255)
 
-        original_arr = np.array(image)
-        result_arr = np.array(result.image)
-        assert np.array_equal(original_arr, result_arr)
+        result = apply_raster_effects(image, _ZERO_STYLE)
 
-    def test_multiple_effects_can_combine(self) -> None:
+        assert np.array_equal(np.asarray(result.image), expected)
+
+    def test_no_effects_returns_rgba_input_without_copying(self, base_image: Image.Image) -> None:
+        """With nothing to apply, an RGBA input should be returned as is."""
+        assert apply_raster_effects(base_image, _ZERO_STYLE).image is base_image
+        # Texture strength alone does nothing without a texture file
+        style = MockStyle(texture_strength=0.5)
+        assert apply_raster_effects(base_image, style).image is base_image
+
+    def test_multiple_effects_can_combine(self, base_image: Image.Image) -> None:
         """Multiple effects should all apply when enabled."""
-        image = create_test_image()
         style = MockStyle(
             grain_strength=0.2,
             vignette_strength=0.3,
             color_grading_strength=0.1,
             seed=99,
         )
-        result = apply_raster_effects(image, style)
+        result = apply_raster_effects(base_image, style)
 
-        original_arr = np.array(image)
-        result_arr = np.array(result.image)
-        assert not np.array_equal(original_arr, result_arr)
+        assert not pixels_equal(base_image, result.image)
 
-    def test_effects_applied_tracks_grain(self) -> None:
-        """effects_applied should include 'grain' when grain is applied."""
-        image = create_test_image()
-        style = MockStyle(grain_strength=0.5, seed=42)
-        result = apply_raster_effects(image, style)
-        assert "grain" in result.effects_applied
-
-    def test_effects_applied_tracks_vignette(self) -> None:
-        """effects_applied should include 'vignette' when vignette is applied."""
-        image = create_test_image()
-        style = MockStyle(vignette_strength=0.5)
-        result = apply_raster_effects(image, style)
-        assert "vignette" in result.effects_applied
-
-    def test_effects_applied_tracks_color_grading(self) -> None:
-        """effects_applied should include 'color_grading' when color grading is applied."""
-        image = create_test_image()
-        style = MockStyle(color_grading_strength=0.5)
-        result = apply_raster_effects(image, style)
-        assert "color_grading" in result.effects_applied
+    @pytest.mark.parametrize("effect", ["grain", "vignette", "color_grading"])
+    def test_effects_applied_tracks(
+        self, effect_results: dict[str, PostProcessResult], effect: str
+    ) -> None:
+        """effects_applied should include each effect that was applied."""
+        assert effect in effect_results[effect].effects_applied
 
-    def test_effects_applied_empty_when_no_effects(self) -> None:
+    def test_effects_applied_empty_when_no_effects(
+        self, effect_results: dict[str, PostProcessResult]
+    ) -> None:
         """effects_applied should be empty when no effects are applied."""
-        image = create_test_image()
-        style = MockStyle()
-        result = apply_raster_effects(image, style)
-        assert result.effects_applied == ()
+        assert effect_results["none"].effects_applied == ()
 
-    def test_grain_seed_is_captured(self) -> None:
+    def test_grain_seed_is_captured(self, effect_results: dict[str, PostProcessResult]) -> None:
         """grain_seed should be captured when grain is applied."""
-        image = create_test_image()
-        style = MockStyle(grain_strength=0.5, seed=12345)
-        result = apply_raster_effects(image, style)
-        assert result.grain_seed == 12345
+        assert effect_results["grain"].grain_seed == 42
 
-    def test_grain_seed_none_when_no_grain(self) -> None:
+    def test_grain_seed_none_when_no_grain(
+        self, effect_results: dict[str, PostProcessResult]
+    ) -> None:
         """grain_seed should be None when grain is not applied."""
-        image = create_test_image()
-        style = MockStyle(vignette_strength=0.5)
-        result = apply_raster_effects(image, style)
-        assert result.grain_seed is None
+        assert effect_results["vignette"].grain_seed is None
 
 
 class TestPostProcessResult:
     """Tests for PostProcessResult dataclass."""
 
-    def test_holds_image(self) -> None:
+    def test_holds_image(self, base_image: Image.Image) -> None:
         """PostProcessResult should store the image."""
-        image = create_test_image()
-        result = PostProcessResult(image=image)
-        assert result.image is image
+        result = PostProcessResult(image=base_image)
+        assert result.image is base_image
 
-    def test_holds_effects_applied(self) -> None:
+    def test_holds_effects_applied(self, base_image: Image.Image) -> None:
         """PostProcessResult should store effects_applied."""
-        image = create_test_image()
-        result = PostProcessResult(image=image, effects_applied=("grain", "vignette"))
+        result = PostProcessResult(image=base_image, effects_applied=("grain", "vignette"))
         assert result.effects_applied == ("grain", "vignette")
 
-    def test_holds_grain_seed(self) -> None:
+    def test_holds_grain_seed(self, base_image: Image.Image) -> None:
         """PostProcessResult should store grain_seed."""
-        image = create_test_image()
-        result = PostProcessResult(image=image, grain_seed=12345)
+        result = PostProcessResult(image=base_image, grain_seed=12345)
         assert result.grain_seed == 12345
 
-    def test_defaults(self) -> None:
+    def test_defaults(self, base_image: Image.Image) -> None:
         """PostProcessResult should have sensible defaults."""
-        image = create_test_image()
-        result = PostProcessResult(image=image)
+        result = PostProcessResult(image=base_image)
         assert result.effects_applied == ()
         assert result.grain_seed is None
 
     def test_is_frozen(self) -> None:
         """PostProcessResult should be immutable."""
-        image = create_test_image()
-        result = PostProcessResult(image=image)
-        with pytest.raises(AttributeError):
-            result.image = create_test_image()  # type: ignore[misc]
+        assert PostProcessResult.__dataclass_params__.frozen is True  # type: ignore[attr-defined]
@@ -6,6 +6,7 @@ from typing import ClassVar
 from unittest.mock import MagicMock
 
 import geopandas as gpd
+import pandas as pd
 import pytest
 from shapely.geometry import LineString
 
@@ -323,6 +324,25 @@ def test_build_layers_creates_casing_and_core(monkeypatch: pytest.MonkeyPatch) -
 
     motorway_core = next(layer for layer in layers if layer.name == "roads_motorway_core")
     assert motorway_core.style["glow"] > 0
+    assert motorway_core.gdf["highway"].tolist() == ["motorway"]
+
+
+def test_road_classes_normalizes_mixed_highway_values() -> None:
+    """Test road classification of string, list and missing highway values."""
+    config = MagicMock()
+    config.theme = load_theme("noir")
+    renderer = PosterRenderer(config)
+
+    highway = pd.Series(["motorway", ["trunk", "primary"], None, float("nan"), [], "unknown"])
+
+    assert renderer._road_classes(highway).tolist() == [
+        "motorway",
+        "primary",
+        "residential",  # None normalizes to "unclassified"
+        "default",
+        "residential",  # Empty list normalizes to "unclassified"
+        "default",
+    ]
 
 
 def test_get_backend_falls_back_to_matplotlib() -> None:
@@ -561,6 +581,11 @@ class TestTypography:
         assert renderer._split_city_name("paris").isupper()
         assert renderer._split_city_name("los angeles").isupper()
 
+    def test_split_city_name_is_cached_per_name(self, renderer: PosterRenderer) -> None:
+        """Repeated splits of the same name should reuse the cached result."""
+        first = renderer._split_city_name("Rio de Janeiro Brazil")
+        assert renderer._split_city_name("Rio de Janeiro Brazil") is first
+
     def test_apply_tracking_single_line(self, renderer: PosterRenderer) -> None:
         """Tracking adds spaces between characters on single line."""
         result = renderer._apply_tracking("ABC", 2)
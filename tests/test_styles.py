@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import re
 from typing import TYPE_CHECKING
 
 import pytest
@@ -20,16 +20,18 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def test_get_available_presets_contains_noir() -> None:
-    """Test that noir preset is available."""
-    presets = get_available_presets()
-    assert "noir" in presets
+# Error message patterns, compiled once for pytest.raises(match=...)
+_UNKNOWN_PRESET_RE = re.compile("Unknown preset")
+_UNKNOWN_KEYS_RE = re.compile("Unknown style pack keys")
+_GRAIN_COARSENESS_RE = re.compile("grain_coarseness must be an integer")
 
+# Pre-encoded style pack payloads: one valid, one with a key StyleConfig lacks
+_GOOD_PACK = b'{"theme_name": "noir", "road_glow_strength": 0.3}'
+_BAD_PACK = b'{"theme_name": "noir", "unknown_key": 123}'
 
-def test_get_available_presets_contains_all_expected() -> None:
-    """Test that all expected presets are available."""
-    presets = get_available_presets()
-    expected = {
+# Built-in presets that must always be available
+_EXPECTED_PRESETS = frozenset(
+    {
         "noir",
         "blueprint",
         "neon_cyberpunk",
@@ -38,7 +40,18 @@ def test_get_available_presets_contains_all_expected() -> None:
         "vintage",
         "film_noir",
     }
-    assert expected.issubset(set(presets))
+)
+
+
+def test_get_available_presets_contains_noir() -> None:
+    """Test that noir preset is available."""
+    presets = get_available_presets()
+    assert "noir" in presets
+
+
+def test_get_available_presets_contains_all_expected() -> None:
+    """Test that all expected presets are available."""
+    assert _EXPECTED_PRESETS.issubset(get_available_presets())
 
 
 def test_get_style_preset_returns_style_config() -> None:
@@ -48,6 +61,11 @@ def test_get_style_preset_returns_style_config() -> None:
     assert style.theme_name == "noir"
 
 
+def test_style_config_is_slotted() -> None:
+    """Test that StyleConfig instances use slots instead of a per-instance dict."""
+    assert not hasattr(get_style_preset("noir"), "__dict__")
+
+
 def test_get_preset_description_returns_string() -> None:
     """Test that get_preset_description returns a description."""
     desc = get_preset_description("noir")
@@ -57,52 +75,69 @@ def test_get_preset_description_returns_string() -> None:
 
 def test_get_preset_description_raises_for_unknown() -> None:
     """Test that get_preset_description raises for unknown preset."""
-    with pytest.raises(KeyError, match="Unknown preset"):
+    with pytest.raises(KeyError, match=_UNKNOWN_PRESET_RE):
         get_preset_description("nonexistent_preset")
 
 
-def test_presets_have_meaningful_values() -> None:
+def test_get_style_preset_raises_for_unknown() -> None:
+    """Test that get_style_preset raises for unknown preset without chaining."""
+    with pytest.raises(KeyError, match=_UNKNOWN_PRESET_RE) as exc_info:
+        get_style_preset("nonexistent_preset")
+    assert exc_info.value.__suppress_context__
+
+
+@pytest.mark.parametrize(
+    ("preset_name", "attribute"),
+    [
+        # vintage and film_noir should have grain and vignette
+        ("vintage", "grain_strength"),
+        ("vintage", "vignette_strength"),
+        ("film_noir", "grain_strength"),
+        ("film_noir", "vignette_strength"),
+        # neon_cyberpunk should have glow
+        ("neon_cyberpunk", "road_glow_strength"),
+    ],
+)
+def test_presets_have_meaningful_values(preset_name: str, attribute: str) -> None:
     """Test that presets have non-default post-processing values."""
-    # vintage and film_noir should have grain
-    vintage = get_style_preset("vintage")
-    assert vintage.grain_strength > 0
-    assert vintage.vignette_strength > 0
+    assert getattr(get_style_preset(preset_name), attribute) > 0
 
-    film_noir = get_style_preset("film_noir")
-    assert film_noir.grain_strength > 0
-    assert film_noir.vignette_strength > 0
 
-    # neon_cyberpunk should have glow
-    neon = get_style_preset("neon_cyberpunk")
-    assert neon.road_glow_strength > 0
+@pytest.fixture(scope="module")
+def style_pack_files(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory holding a valid (good.json) and an invalid (bad.json) style pack."""
+    pack_dir = tmp_path_factory.mktemp("packs")
+    (pack_dir / "good.json").write_bytes(_GOOD_PACK)
+    (pack_dir / "bad.json").write_bytes(_BAD_PACK)
+    return pack_dir
 
 
-def test_load_style_pack_valid(tmp_path: Path) -> None:
+def test_load_style_pack_valid(style_pack_files: Path) -> None:
     """Test loading a valid style pack from JSON."""
-    style_pack = {
-        "theme_name": "noir",
-        "road_glow_strength": 0.3,
-    }
-    path = tmp_path / "pack.json"
-    path.write_text(json.dumps(style_pack), encoding="utf-8")
-
-    style = load_style_pack(str(path))
+    style = load_style_pack(style_pack_files / "good.json")
     assert style.theme_name == "noir"
     assert style.road_glow_strength == 0.3
 
 
-def test_load_style_pack_rejects_unknown_keys(tmp_path: Path) -> None:
+def test_load_style_pack_rejects_unknown_keys(style_pack_files: Path) -> None:
     """Test that unknown keys in style pack raise ValueError."""
-    style_pack = {
-        "theme_name": "noir",
-        "unknown_key": 123,
-    }
-    path = tmp_path / "bad_pack.json"
-    path.write_text(json.dumps(style_pack), encoding="utf-8")
-
-    with pytest.raises(ValueError, match="Unknown style pack keys"):
-        load_style_pack(str(path))
-    path.write_text(json.dumps(style_pack), encoding="utf-8")
-
-    with pytest.raises(ValueError, match="Unknown style pack keys"):
-        load_style_pack(str(path))
+    with pytest.raises(ValueError, match=_UNKNOWN_KEYS_RE):
+        load_style_pack(style_pack_files / "bad.json")
+
+
+def test_load_style_pack_coerces_integral_grain_coarseness(tmp_path: Path) -> None:
+    """Test that an integral float grain_coarseness is loaded as an int."""
+    pack = tmp_path / "pack.json"
+    pack.write_bytes(b'{"grain_coarseness": 2.0}')
+    style = load_style_pack(pack)
+    assert style.grain_coarseness == 2
+    assert type(style.grain_coarseness) is int
+
+
+@pytest.mark.parametrize("value", [b"2.5", b'"4"', b"true", b"0", b"17"])
+def test_load_style_pack_rejects_invalid_grain_coarseness(tmp_path: Path, value: bytes) -> None:
+    """Test that non-integral or out-of-range grain_coarseness raises ValueError."""
+    pack = tmp_path / "pack.json"
+    pack.write_bytes(b'{"grain_coarseness": ' + value + b"}")
+    with pytest.raises(ValueError, match=_GRAIN_COARSENESS_RE):
+        load_style_pack(pack)